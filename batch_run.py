@@ -0,0 +1,210 @@
+"""
+Headless batch run of bridge project inputs (no Qt).
+
+Reads a CSV or JSONL file of projects with the Basic Inputs fields, resolves
+each location's environmental data, runs the validators and geometry
+calculators, and writes the enriched records as CSV or JSONL.
+
+    python batch_run.py projects.csv -o results.jsonl --jobs 4
+
+Input fields: structure_type, state, district, span, carriageway, footpath,
+skew, girder_steel, bracing_steel, deck_concrete and optionally girders,
+overhang or spacing. The state may be left blank when the district name is unique.
+Given girders, spacing and overhang values are checked against the layout
+limits in utils/validators.py; a failure is a row error and no geometry is solved.
+"""
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.location_repository import DB_PATH, LocationRepository
+from utils.spatial_index import LazyStationIndex
+from utils.validators import validate_girders, validate_spacing
+from utils.validators_batch import MESSAGES, OK, SKEW_DETAILED_ANALYSIS, validate_columns
+from utils.geometry_calculator import calculate_girders, calculate_spacing, overall_width
+from utils.layout_enumerator import top_layouts
+from utils.project_options import (STRUCTURE_TYPES, FOOTPATH_OPTIONS, STEEL_GRADES, CONCRETE_GRADES,
+                                   ZONE_FACTORS, DEFAULT_GIRDERS, DEFAULT_OVERHANG)
+
+VALIDATED_FIELDS = ["span", "carriageway", "skew"]
+# Optional layout inputs; validated only when given, the dialog's defaults apply otherwise
+LAYOUT_FIELDS = ["girders", "spacing", "overhang"]
+CHOICE_FIELDS = {
+    "structure_type": STRUCTURE_TYPES,
+    "footpath": FOOTPATH_OPTIONS,
+    "girder_steel": STEEL_GRADES,
+    "bracing_steel": STEEL_GRADES,
+    "deck_concrete": CONCRETE_GRADES,
+}
+
+# Opened once per worker process by init_worker
+locations = None
+estimator = None
+
+def init_worker(db_path):
+    global locations, estimator
+    locations = LocationRepository(db_path)
+    estimator = LazyStationIndex(locations) # Built only if a record lacks values
+
+def text(record, field):
+    value = record.get(field)
+    return "" if value is None else str(value).strip()
+
+def resolve_location(record):
+    """Returns ((state, info), error) for the record's state/district."""
+    state, district = text(record, "state"), text(record, "district")
+    if not district:
+        return (state, None), "District missing."
+    if not state:
+        states = locations.states_for_district(district)
+        if len(states) != 1:
+            return (state, None), f"State needed for district '{district}'." if states else f"Unknown district '{district}'."
+        state = states[0]
+    info = locations.get(state, district)
+    if info is None:
+        return (state, None), f"Unknown location '{district}, {state}'."
+    return (state, estimator.fill(info)), None
+
+def solve_geometry(record, carriageway, span):
+    # Same defaults and rebalancing as ModifyGeometryDialog
+    width = overall_width(carriageway)
+    overhang = float(text(record, "overhang") or DEFAULT_OVERHANG)
+    if text(record, "girders"):
+        girders = int(text(record, "girders"))
+    elif text(record, "spacing"):
+        girders = max(1, calculate_girders(width, float(text(record, "spacing")), overhang))
+    else:
+        girders = DEFAULT_GIRDERS
+    result = {
+        "overall_width": width,
+        "girders": girders,
+        "overhang": overhang,
+        "spacing": round(calculate_spacing(width, girders, overhang), 3),
+    }
+    best = top_layouts(carriageway, span, count=1)
+    if best:
+        result["suggested_layout"] = (f"{best[0]['girders']} @ {best[0]['spacing']:.2f} m, "
+                                      f"overhang {best[0]['overhang']:.2f} m")
+    return result
+
+def enrich(record, checks):
+    errors, warnings = [], []
+    result = dict(record)
+
+    for field, options in CHOICE_FIELDS.items():
+        value = text(record, field)
+        if value and value not in options:
+            errors.append(f"Unknown {field} '{value}'.")
+    if text(record, "structure_type") == "Other":
+        errors.append("Other structures not included.")
+
+    for field, (valid, code) in checks.items():
+        if field in LAYOUT_FIELDS and not text(record, field):
+            continue
+        if code == SKEW_DETAILED_ANALYSIS:
+            warnings.append(MESSAGES[code])
+        elif code != OK:
+            errors.append(f"{field}: {MESSAGES[code]}")
+
+    (state, info), error = resolve_location(record)
+    if error:
+        errors.append(error)
+    else:
+        zone = info.get("zone", "N/A")
+        result.update({
+            "state": state,
+            "wind": info.get("wind", "N/A"),
+            "zone": zone,
+            "zone_factor": ZONE_FACTORS.get(zone, "N/A"),
+            "max_temp": info.get("max", "N/A"),
+            "min_temp": info.get("min", "N/A"),
+            "estimated": ",".join(info.get("estimated", ())),
+        })
+
+    layout_ok = all(checks[field][0] for field in LAYOUT_FIELDS if text(record, field))
+    if checks["carriageway"][0] and layout_ok:
+        span = float(text(record, "span")) if checks["span"][0] else None
+        try:
+            geometry = solve_geometry(record, float(text(record, "carriageway")), span)
+        except ValueError:
+            errors.append("Invalid girders, overhang or spacing.")
+        else:
+            result.update(geometry)
+            # Valid inputs can still fit the deck badly, e.g. the default 4 girders on a wide deck
+            for field, validator in (("girders", validate_girders), ("spacing", validate_spacing)):
+                ok, message = validator(geometry[field])
+                if not ok:
+                    warnings.append(f"Resulting {field}: {message}")
+
+    result["status"] = "error" if errors else ("warning" if warnings else "ok")
+    result["messages"] = "; ".join(errors + warnings)
+    return result
+
+def process_chunk(records):
+    # Validate the chunk column-wise, then enrich record by record
+    columns = {field: [text(r, field) for r in records] for field in VALIDATED_FIELDS + LAYOUT_FIELDS}
+    checks, _ = validate_columns(columns)
+    return [
+        enrich(record, {field: (bool(mask[i]), int(codes[i])) for field, (mask, codes) in checks.items()})
+        for i, record in enumerate(records)
+    ]
+
+def read_records(path):
+    with open(path, newline='') as f:
+        if path.lower().endswith(".csv"):
+            return list(csv.DictReader(f))
+        return [json.loads(line) for line in f if line.strip()]
+
+def write_results(results, path):
+    out = open(path, 'w', newline='') if path else sys.stdout
+    try:
+        if path and path.lower().endswith(".csv"):
+            fields = list(dict.fromkeys(key for result in results for key in result))
+            writer = csv.DictWriter(out, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(results)
+        else:
+            for result in results:
+                out.write(json.dumps(result) + "\n")
+    finally:
+        if path:
+            out.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate and enrich bridge projects without the GUI.")
+    parser.add_argument("input", help="Projects as .csv or .jsonl")
+    parser.add_argument("-o", "--output", help="Results as .csv or .jsonl (default: JSONL on stdout)")
+    parser.add_argument("--jobs", "-j", type=int, default=0,
+                        help="Worker processes (default: 0 = all cores, 1 = run in-process)")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Projects per worker task")
+    parser.add_argument("--db", default=DB_PATH, help="Location database (default: data/osdag.db)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    records = read_records(args.input)
+    chunks = [records[i:i + args.chunk_size] for i in range(0, len(records), args.chunk_size)]
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    results = []
+    if jobs > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(args.db,)) as pool:
+            for chunk_results in pool.map(process_chunk, chunks):
+                results.extend(chunk_results)
+    else:
+        init_worker(args.db)
+        for chunk in chunks:
+            results.extend(process_chunk(chunk))
+
+    write_results(results, args.output)
+
+    counts = {status: sum(1 for r in results if r["status"] == status) for status in ("ok", "warning", "error")}
+    print(f"{len(results)} projects in {time.perf_counter() - start:.2f}s: "
+          f"{counts['ok']} ok, {counts['warning']} warnings, {counts['error']} errors", file=sys.stderr)
+    return 1 if counts["error"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+Benchmarks for the india_data.json rebuild path (utils/extract_all.py).
+
+Times PDF extraction and every parse_* stage on the bundled PDFs, and the
+parse + update_db_fuzzy stages on synthetic tables scaled 10x/100x from
+data/india_data.json. Records wall time, peak traced memory and record/match
+counts per stage to a JSON baseline. A stage that yields no lines, records
+or matches is reported as EMPTY, and --save / --compare refuse to run with
+one: its timing says nothing about the parsers.
+
+    python benchmarks/bench_extract.py                       # print results
+    python benchmarks/bench_extract.py --skip-pdfs --save    # rewrite baseline.json
+    python benchmarks/bench_extract.py --skip-pdfs --compare # fail on regressions
+"""
+import os
+import io
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tracemalloc
+import contextlib
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from utils import extract_all
+
+BASELINE_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DATA_JSON = os.path.join(BASE_DIR, "data", "india_data.json")
+SCALES = [1, 10, 100]
+SYLLABLES = ["pur", "nagar", "abad", "garh", "kot", "ganj", "pet", "wada", "ura", "pali",
+             "mer", "han", "sar", "dhan", "ra", "ma", "la", "ka", "ta", "vel", "gudi", "halli"]
+
+def measure(fn, repeat):
+    # Best-of-N wall time, then one extra run under tracemalloc for peak memory
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = fn()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": min(times), "peak_kb": round(peak / 1024, 1)}, result
+
+def synthetic_tables(scale, seed=1893):
+    """
+    Builds Temp/Wind/Seismic table lines with `scale` times the cities of india_data.json.
+    Scale 1 is the bundled data itself; larger scales add generated town names.
+    Roughly a third of the wind/seismic names carry a one-letter typo so the fuzzy path runs.
+    """
+    rng = random.Random(seed + scale)
+    with open(DATA_JSON, 'r') as f:
+        base = json.load(f)
+
+    names = {city for cities in base.values() for city in cities}
+    states = {state: list(cities.items()) for state, cities in base.items()}
+    target = len(names) * scale
+    state_names = list(states)
+    while len(names) < target:
+        name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).title()
+        if name in names:
+            continue
+        names.add(name)
+        template = rng.choice(list(base[rng.choice(state_names)].values()))
+        states[rng.choice(state_names)].append((name, template))
+
+    temp, wind, seismic = [], [], []
+    for state, cities in states.items():
+        temp.append(state)
+        for city, info in cities:
+            temp.append(f"{city} {info['max']} {info['min']}")
+            flat = city.upper()
+            if rng.random() < 0.33 and len(flat) > 5:
+                cut = rng.randrange(1, len(flat) - 1)
+                flat = flat[:cut] + flat[cut + 1:]
+            wind.append(f"{flat} {info['wind']}")
+            seismic.append(f"{flat} {info['zone']}")
+    return temp, wind, seismic
+
+def bench_pdfs(repeat):
+    results = {}
+    for name, path, parse, _ in extract_all.STAGES:
+        stats, lines = measure(lambda: extract_all.get_pdf_text(path), repeat)
+        stats["lines"] = len(lines)
+        results[f"pdf.get_pdf_text.{name}"] = stats
+        for mode in extract_all.MODES:
+            stats, parsed = measure(lambda: parse(mode=mode), repeat)
+            stats["records"] = extract_all.count_records(name, parsed)
+            results[f"pdf.{parse.__name__}.{name}.{mode}"] = stats
+    return results
+
+def bench_synthetic(scale, repeat):
+    results = {}
+    temp, wind_lines, seismic_lines = synthetic_tables(scale)
+    prefix = f"synthetic.x{scale}"
+
+    stats, master = measure(lambda: extract_all.parse_temp_hierarchy(temp), repeat)
+    stats["records"] = extract_all.count_records("temp", master)
+    results[f"{prefix}.parse_temp_hierarchy"] = stats
+
+    stats, wind = measure(lambda: extract_all.parse_wind_flat(wind_lines), repeat)
+    stats["records"] = len(wind)
+    results[f"{prefix}.parse_wind_flat"] = stats
+
+    stats, seis = measure(lambda: extract_all.parse_seismic_flat(seismic_lines), repeat)
+    stats["records"] = len(seis)
+    results[f"{prefix}.parse_seismic_flat"] = stats
+
+    # update_db_fuzzy only overwrites data_key on each record, so reruns are idempotent
+    for key, flat in (("wind", wind), ("zone", seis)):
+        stats, merged = measure(lambda: extract_all.update_db_fuzzy(master, flat, key), repeat)
+        stats["matches"] = sum(1 for cities in merged.values()
+                               for info in cities.values() if info[key] != "N/A")
+        results[f"{prefix}.update_db_fuzzy.{key}"] = stats
+    return results
+
+def empty_stages(results):
+    # Stages that produced nothing only time the plumbing, e.g. on PDFs whose tables aren't text
+    return [stage for stage, stats in results.items()
+            if any(stats.get(count) == 0 for count in ("lines", "records", "matches"))]
+
+def compare(results, baseline, tolerance):
+    # Flags stages that got slower than tolerance, or whose counts changed
+    regressions = []
+    for stage, stats in results.items():
+        old = baseline.get(stage)
+        if not old:
+            continue
+        if stats["seconds"] > old["seconds"] * (1 + tolerance):
+            regressions.append(f"{stage}: {old['seconds']:.4f}s -> {stats['seconds']:.4f}s")
+        for count in ("lines", "records", "matches"):
+            if count in old and stats.get(count) != old[count]:
+                regressions.append(f"{stage}: {count} {old[count]} -> {stats.get(count)}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the extraction and merge pipeline.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage (best is kept)")
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES,
+                        help="Synthetic city multipliers (default: 1 10 100)")
+    parser.add_argument("--skip-pdfs", action="store_true", help="Only run the synthetic stages")
+    parser.add_argument("--baseline", default=BASELINE_JSON, help="Baseline JSON path")
+    parser.add_argument("--save", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="Exit non-zero on regressions vs the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown before a stage counts as a regression (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    if not args.skip_pdfs:
+        results.update(bench_pdfs(args.repeat))
+    for scale in args.scales:
+        results.update(bench_synthetic(scale, args.repeat))
+
+    width = max(len(stage) for stage in results)
+    for stage, stats in results.items():
+        counts = "  ".join(f"{k}={v}" for k, v in stats.items() if k not in ("seconds", "peak_kb"))
+        print(f"{stage:<{width}}  {stats['seconds'] * 1000:10.2f} ms  {stats['peak_kb']:10.1f} KiB  {counts}")
+
+    empty = empty_stages(results)
+    for stage in empty:
+        print(f"EMPTY {stage}: no lines, records or matches")
+    if empty and (args.save or args.compare):
+        print("Not saving or comparing a baseline with empty stages; run with --skip-pdfs "
+              "if the bundled PDFs yield no table text")
+        return 1
+
+    if args.save:
+        with open(args.baseline, 'w') as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "stages": results}, f, indent=4)
+        print(f"Saved baseline to {args.baseline}")
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}")
+            return 1
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)["stages"]
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
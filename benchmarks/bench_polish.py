@@ -0,0 +1,88 @@
+"""
+Benchmark of window style polish: one consolidated stylesheet (ui/theme.py)
+against the old per-widget setStyleSheet calls.
+
+"per-widget" applies theme.BASE to the application and then each widget's
+rules from theme.WIDGET_RULES with its own setStyleSheet, as the windows used
+to; "consolidated" applies theme.build_stylesheet() once. Each run builds the
+window, then times the style work (per-widget sheets plus polishing every
+widget) and, separately, showing it until it is laid out and painted.
+
+    python benchmarks/bench_polish.py --repeat 10
+"""
+import os
+import sys
+import time
+import argparse
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from ui import theme
+from ui.welcome_window import WelcomeWindow
+from ui.main_window import MainWindow
+from ui.modify_geometry_dialog import ModifyGeometryDialog
+from utils.geometry_model import GeometryModel
+
+WINDOWS = {
+    "welcome": WelcomeWindow,
+    "main": MainWindow,
+    "geometry dialog": lambda: ModifyGeometryDialog(GeometryModel(carriageway="10")),
+}
+
+def apply_widget_sheets(window):
+    # The old way: every styled widget parses and polishes its own sheet
+    for widget in [window] + window.findChildren(QWidget):
+        rules = theme.WIDGET_RULES.get(widget.objectName())
+        if rules:
+            widget.setStyleSheet(rules)
+
+def open_window(app, factory, per_widget):
+    window = factory()
+    start = time.perf_counter()
+    if per_widget:
+        apply_widget_sheets(window)
+    for widget in [window] + window.findChildren(QWidget):
+        widget.ensurePolished()
+    polished = time.perf_counter()
+    window.show()
+    app.processEvents()
+    shown = time.perf_counter()
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return polished - start, shown - polished
+
+def run(app, repeat):
+    sheets = {"per-widget": theme.BASE, "consolidated": theme.build_stylesheet()}
+    results = {}
+    for name, factory in WINDOWS.items():
+        for mode, sheet in sheets.items():
+            app.setStyleSheet(sheet)
+            open_window(app, factory, mode == "per-widget") # Warm-up (imports, fonts, image cache)
+            runs = [open_window(app, factory, mode == "per-widget") for _ in range(repeat)]
+            results[(name, mode)] = (min(r[0] for r in runs), min(r[1] for r in runs))
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time window polish with per-widget vs consolidated stylesheets.")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per window and mode; the best is reported")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    results = run(app, args.repeat)
+
+    print(f"{'window':<18}{'phase':<8}{'per-widget':>14}{'consolidated':>14}{'saved':>10}")
+    for name in WINDOWS:
+        old = results[(name, "per-widget")]
+        new = results[(name, "consolidated")]
+        for i, phase in enumerate(("polish", "show")):
+            print(f"{name:<18}{phase:<8}{old[i] * 1000:>11.2f} ms{new[i] * 1000:>11.2f} ms"
+                  f"{(1 - new[i] / old[i]) * 100:>9.0f}%")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark of project files (utils/project.py) on synthetic multi-span projects.
+
+Each project holds the Basic Inputs fields plus a "spans" list of per-span
+inputs. Times a full save and a load in the binary format against JSON, and
+the GUI-thread cost of an autosave after one span changed (collecting the
+change and queueing it; the write itself runs on the autosave thread).
+
+    python benchmarks/bench_project.py --spans 10 100 1000 10000
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from utils.project import ProjectDocument, Autosaver, write_project, read_project, export_json
+
+def synthetic_project(spans, seed=2026):
+    rng = random.Random(seed + spans)
+    return {
+        "structure_type": "Highway", "location_mode": "city", "state": "Kerala", "district": "Kochi",
+        "custom_loading": None, "span": "35", "carriageway": "10.5", "footpath": "Both", "skew": "5",
+        "girder_steel": "E350", "bracing_steel": "E250", "deck_concrete": "M40",
+        "geometry": {"overhang": 1.0, "lead": "girders", "spacing_request": None, "girders_request": 4},
+        "spans": [{"length": round(rng.uniform(20, 45), 2), "skew": round(rng.uniform(0, 15), 1),
+                   "girders": rng.randint(3, 8), "spacing": round(rng.uniform(1.8, 3.5), 3),
+                   "girder_steel": rng.choice(["E250", "E350", "E450"]),
+                   "label": f"Span {i + 1}"} for i in range(spans)],
+    }
+
+def best(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def run(spans, repeat, workdir):
+    fields = synthetic_project(spans)
+    binary_path = os.path.join(workdir, f"project_{spans}.osdp")
+    json_path = os.path.join(workdir, f"project_{spans}.json")
+
+    def load_json():
+        with open(json_path, encoding="utf-8") as f:
+            json.load(f)
+
+    result = {
+        "save": best(lambda: write_project(binary_path, fields), repeat),
+        "save_json": best(lambda: export_json(fields, json_path), repeat),
+        "load": best(lambda: read_project(binary_path), repeat),
+        "load_json": best(load_json, repeat),
+        "size": os.path.getsize(binary_path),
+        "size_json": os.path.getsize(json_path),
+    }
+
+    # One span edited per autosave, as a user would between ticks
+    document = ProjectDocument(fields, binary_path, frames=1)
+    autosaver = Autosaver()
+    costs = []
+    for i in range(repeat):
+        edited = list(document.fields["spans"])
+        edited[i % spans] = dict(edited[i % spans], length=50.0 + i)
+        start = time.perf_counter()
+        document.update({"spans": edited, "skew": str(i)})
+        autosaver.autosave(document)
+        costs.append(time.perf_counter() - start)
+    autosaver.close()
+    result["autosave"] = min(costs)
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time project save/load and autosave.")
+    parser.add_argument("--spans", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the best is reported")
+    args = parser.parse_args(argv)
+
+    print(f"{'spans':>7}{'save':>10}{'json':>10}{'load':>10}{'json':>10}{'size':>10}{'json':>10}{'autosave':>10}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for spans in args.spans:
+            r = run(spans, args.repeat, workdir)
+            print(f"{spans:>7}{r['save'] * 1000:>8.2f}ms{r['save_json'] * 1000:>8.2f}ms"
+                  f"{r['load'] * 1000:>8.2f}ms{r['load_json'] * 1000:>8.2f}ms"
+                  f"{r['size'] / 1024:>8.1f}KB{r['size_json'] / 1024:>8.1f}KB{r['autosave'] * 1000:>8.2f}ms")
+
+if __name__ == "__main__":
+    main()
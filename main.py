@@ -1,159 +1,141 @@
 import sys
-from PyQt6.QtWidgets import QApplication
-from ui.main_window import MainWindow
+import time
+import argparse
+import importlib
+import threading
+import traceback
+from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtCore import QObject, pyqtSignal
 from ui.welcome_window import WelcomeWindow
+from ui.image_cache import image_cache, STARTUP_IMAGES
+from ui.theme import apply_theme
+from utils import instrument
 
 from PyQt6.QtGui import QIcon
 import os
 
+class StartupProfiler:
+    """Prints per-phase startup timings when --profile-startup is given."""
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.start = self.last = time.perf_counter()
+        self.lock = threading.Lock()
+
+    def mark(self, phase):
+        if not self.enabled:
+            return
+        with self.lock:
+            now = time.perf_counter()
+            print(f"[startup] {phase:<32} {(now - self.last) * 1000:8.1f} ms   (t = {(now - self.start) * 1000:.1f} ms)")
+            self.last = now
+
+class Preloader(QObject):
+    """
+    Imports the main window modules and opens the location store on a background
+    thread while the welcome screen is up. `ready` is delivered on the GUI thread,
+    also when the preload failed; `error` then holds the exception.
+    """
+    ready = pyqtSignal()
+
+    def __init__(self, profiler):
+        super().__init__()
+        self.profiler = profiler
+        self.main_window_class = None
+        self.locations = None
+        self.error = None
+        self.thread = threading.Thread(target=self.run, name="preload", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def run(self):
+        try:
+            self.load()
+        except Exception as e:
+            # Retried in the foreground on Start (see main), where it can be reported
+            self.error = e
+            print(f"Background preload failed: {e}")
+        self.ready.emit()
+
+    def load(self):
+        module = importlib.import_module("ui.main_window")
+        self.main_window_class = module.MainWindow
+        self.profiler.mark("import main window")
+
+        from utils.shared_locations import shared_locations
+        self.locations = shared_locations() # Shared by every project window
+        self.profiler.mark("load shared locations")
+
+    def wait(self):
+        self.thread.join()
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="OSDAG Group Design")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Print per-phase startup timings")
+    parser.add_argument("--trace", nargs="?", const=instrument.DEFAULT_TRACE_PATH, metavar="FILE",
+                        help="Time UI slots and background work, write a Chrome trace on exit "
+                             "(default: osdag_trace.json; also OSDAG_TRACE=1)")
+    # Anything else (e.g. -platform) is left for Qt
+    return parser.parse_known_args(argv)
+
 def main():
-    app = QApplication(sys.argv)
+    args, qt_args = parse_args(sys.argv[1:])
+    if args.trace:
+        instrument.enable(args.trace)
+    profiler = StartupProfiler(args.profile_startup)
+    app = QApplication(sys.argv[:1] + qt_args)
+    profiler.mark("create QApplication")
 
     # Set App Icon
     icon_path = os.path.join(os.path.dirname(__file__), "assets", "app_icon.png")
     if os.path.exists(icon_path):
         app.setWindowIcon(QIcon(icon_path))
     
-    # Global Stylesheet (Custom Color Code)
-    app.setStyleSheet("""
-        QMainWindow {
-            background-color: white;
-        }
-        
-        /* 1. Informational Points (General styling for labels that might be info) */
-        /* Note: Specific info label is styled in basic_inputs_tab.py */
-        
-        /* 2. Dropdowns are Blue */
-        QComboBox {
-            border: 2px solid #1976D2; /* Blue Border */
-            border-radius: 4px;
-            padding: 5px;
-            background: white;
-            color: black;
-        }
-        /* Labels */
-        QLabel {
-            color: black;
-        }
-        QWidget {
-            color: black;
-        }
-        QComboBox::drop-down {
-            subcontrol-origin: padding;
-            subcontrol-position: top right;
-            width: 25px;
-            border-left-width: 1px;
-            border-left-color: #1976D2;
-            border-left-style: solid;
-            border-top-right-radius: 3px;
-            border-bottom-right-radius: 3px;
-            background: white; /* White BG for arrow area */
-        }
-        QComboBox QAbstractItemView {
-            background: white;
-            selection-background-color: #E3F2FD;
-            selection-color: black;
-        }
-        QComboBox:on { /* shift the text when the popup opens */
-            padding-top: 3px;
-            padding-left: 4px;
-        }
-        
-        /* 3. Checkboxes are Orange */
-        QCheckBox {
-            spacing: 5px;
-        }
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-            border: 2px solid #F57C00; /* Orange Border */
-            border-radius: 3px;
-            background: white;
-        }
-        QCheckBox::indicator:checked {
-            background-color: #F57C00; /* Orange Fill */
-            image: url(none); /* In real app custom checkmark, standard is fine */
-            border: 2px solid #E65100;
-        }
-        QRadioButton::indicator { /* Applying to Radio too as layout often groups them */
-            width: 18px;
-            height: 18px;
-            border: 2px solid #F57C00;
-            border-radius: 10px;
-            background: white;
-        }
-        QRadioButton::indicator:checked {
-            background-color: #F57C00;
-        }
-        
-        /* 4. Pop-up dialog boxes are Yellow */
-        QDialog {
-            background-color: #FFFDE7; /* Light Yellow Background */
-        }
-        /* Buttons */
-        QPushButton {
-            background-color: #FFFFFF;
-            border: 1px solid #B0BEC5;
-            border-bottom: 3px solid #B0BEC5; /* Pseudo-3D effect */
-            border-radius: 6px;
-            padding: 6px 16px;
-            color: #455A64;
-            font-weight: bold;
-            font-family: "Segoe UI";
-        }
-        QPushButton:hover {
-            background-color: #F1F8E9; /* Slight Green tint for action */
-            border-color: #81C784;
-            border-bottom-color: #66BB6A;
-            color: #2E7D32;
-            margin-top: 1px; /* Press effect simulation */
-            border-bottom-width: 2px;
-        }
-        QPushButton:pressed {
-            background-color: #DCEDC8;
-            margin-top: 3px;
-            border-bottom-width: 0px;
-        }
-        
-        /* Text Inputs */
-        QLineEdit {
-            border: 1px solid #999;
-            border-radius: 4px;
-            padding: 5px;
-            background: white;
-        }
-        QLineEdit:focus {
-            border: 2px solid #1976D2;
-        }
-        
-        /* Tabs (Keeping clean) */
-        QTabWidget::pane {
-            border: 1px solid #CCC;
-            background: white;
-        }
-        QTabBar::tab {
-            background: #EEE;
-            padding: 8px 20px;
-            border: 1px solid #CCC;
-            margin-right: 2px;
-        }
-        QTabBar::tab:selected {
-            background: white;
-            border-bottom: 2px solid #1976D2; /* Blue accent */
-        }
-    """)
+    # One consolidated stylesheet for every window (ui/theme.py)
+    apply_theme(app)
+    profiler.mark("apply global stylesheet")
+
+    # Decode and scale every startup image on worker threads while the windows are built
+    image_cache().preload(STARTUP_IMAGES)
     
     # Window Management
     windows = {}
+    preloader = Preloader(profiler)
+
+    def build_main():
+        # Built hidden as soon as the preload lands, so Start only has to show it
+        if 'main' not in windows and preloader.error is None:
+            windows['main'] = preloader.main_window_class(locations=preloader.locations)
+            profiler.mark("build main window")
     
     def show_main():
-        windows['main'] = MainWindow()
+        profiler.mark("welcome screen until Start")
+        if 'main' not in windows:
+            preloader.wait() # Clicked before the preload finished
+            try:
+                if preloader.error is not None:
+                    # Once more on this thread: a transient failure recovers, a real one is shown
+                    preloader.error = None
+                    preloader.load()
+                build_main()
+            except Exception as e:
+                traceback.print_exc()
+                QMessageBox.critical(windows['welcome'], "Error", f"Could not open the main window:\n{e}")
+                app.exit(1)
+                return
         windows['main'].show()
         windows['welcome'].close()
+        profiler.mark("show main window")
         
     windows['welcome'] = WelcomeWindow()
     windows['welcome'].start_btn.clicked.connect(show_main)
     windows['welcome'].show()
+    app.processEvents() # Paint the welcome screen before any heavy work starts
+    profiler.mark("show welcome window")
+
+    preloader.ready.connect(build_main)
+    preloader.start()
     
     sys.exit(app.exec())
 
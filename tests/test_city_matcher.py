@@ -0,0 +1,49 @@
+"""
+Recall of CityMatcher.best_match on the synthetic tables of bench_extract:
+every temp-table city should find its own wind-table row, which carries a
+one-letter typo for about a third of the cities.
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (BASE_DIR, os.path.join(BASE_DIR, "benchmarks")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from utils.city_matcher import CityMatcher
+from bench_extract import synthetic_tables
+
+def table_pairs(scale):
+    # synthetic_tables writes one wind line per temp city line, in the same order
+    temp, wind, _ = synthetic_tables(scale)
+    cities = [line.rsplit(" ", 2)[0] for line in temp if line.count(" ") >= 2
+              and line.rsplit(" ", 2)[1].replace(".", "").isdigit()]
+    names = [line.rsplit(" ", 1)[0] for line in wind]
+    assert len(cities) == len(names)
+    return list(zip(cities, names))
+
+def recall(pairs):
+    matcher = CityMatcher([name for _, name in pairs])
+    found = 0
+    for city, name in pairs:
+        match = matcher.best_match(city.upper(), threshold=90)
+        if match is not None and match[0] == name:
+            found += 1
+    return found / len(pairs)
+
+def test_recall_on_synthetic_tables():
+    assert recall(table_pairs(1)) == 1.0
+    assert recall(table_pairs(10)) >= 0.99
+
+def test_exact_ties_and_spellings():
+    matcher = CityMatcher(["PORT BLAIR", "PORT-BLAIR", "NEW DELHI", "DELHI", "SECUNDERABAD", "HYDERABAD"])
+    assert matcher.best_match("port blair") == ("PORT BLAIR", 100)
+    assert matcher.best_match("Port-Blair") == ("PORT BLAIR", 100) # First of the equal names
+    assert matcher.best_match("NEW-DELHI") == ("NEW DELHI", 100)
+    assert matcher.best_match("SECUNDRABAD")[0] == "SECUNDERABAD"
+    assert matcher.best_match("HYDRABAD")[0] == "HYDERABAD"
+    assert matcher.best_match("BOMBAY") is None
+    assert matcher.best_match("--") is None
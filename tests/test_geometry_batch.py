@@ -0,0 +1,25 @@
+"""
+utils/geometry_batch.py against the scalar formulas in utils/geometry_calculator.py.
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from utils.geometry_batch import solve_layouts
+from utils.geometry_calculator import calculate_spacing, overall_width
+
+def test_girders_match_scalar_spacing():
+    result = solve_layouts(10.5, 1.0, girders=[2, 4, 6])
+    for girders, spacing in zip(result["girders"], result["spacing"]):
+        assert spacing == calculate_spacing(overall_width(10.5), int(girders), 1.0)
+    assert result["valid"].all()
+
+def test_fractional_girders_are_invalid_not_truncated():
+    result = solve_layouts(10.5, 1.0, girders=[2.9, 3.0, float("nan"), float("inf"), -2])
+    assert result["girders"].tolist() == [0, 3, 0, 0, -2]
+    assert result["valid"].tolist() == [False, True, False, False, False]
@@ -0,0 +1,82 @@
+"""
+The memory-mapped store (utils/location_binary.py) answers every query as
+JsonLocationStore does over the JSON it was written from.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import json
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from utils.location_binary import (BinaryLocationStore, JSON_PATH, write_binary,
+                                   pending_path)
+from utils.location_store import JsonLocationStore
+
+TABLE = {
+    "Kerala": {
+        "Kochi": {"wind": 39, "zone": "III", "max": 38, "min": 20, "lat": 9.93, "lon": 76.26},
+        "Kollam": {"wind": 39.5, "zone": "N/A", "max": 37.2, "min": 21, "lat": 8.89, "lon": 76.61},
+        "Wayanad": {"wind": 33, "zone": "III", "max": "N/A", "min": None,
+                    "lat": 11.6, "lon": 76.08, "estimated": ["wind", "zone"]},
+    },
+    "Andaman & Nicobar": {"Port Blair": {"wind": 44, "zone": "V", "max": 32, "min": 23}},
+    "Uttar Pradesh": {"Aurangabad": {"wind": 47, "zone": "IV", "max": 46, "min": 3}},
+    "Maharashtra": {"Aurangabad": {"wind": 39, "zone": "II", "max": 43, "min": 8},
+                    "Mumbai": {"wind": 44, "zone": "III", "max": 39, "min": 16}},
+    "Ladakh": {},
+}
+
+def check_same_answers(json_path, bin_path):
+    expected = JsonLocationStore(json_path)
+    store = BinaryLocationStore(bin_path)
+    assert store.states() == expected.states()
+    assert store.all_locations() == expected.all_locations()
+    for state in expected.states() + ["Atlantis"]:
+        assert store.districts(state) == expected.districts(state)
+        for district in expected.districts(state) + ["Nowhere"]:
+            assert store.get(state, district) == expected.get(state, district), (state, district)
+            assert store.states_for_district(district) == expected.states_for_district(district)
+    store.close()
+
+def write_both(tmp_path, table):
+    json_path, bin_path = str(tmp_path / "india_data.json"), str(tmp_path / "india_data.bin")
+    with open(json_path, "w") as f:
+        json.dump(table, f)
+    assert write_binary(table, bin_path) == sum(len(districts) for districts in table.values())
+    return json_path, bin_path
+
+def test_round_trip_matches_json_store(tmp_path):
+    check_same_answers(*write_both(tmp_path, TABLE))
+
+def test_round_trip_of_bundled_data(tmp_path):
+    with open(JSON_PATH) as f:
+        table = json.load(f)
+    check_same_answers(*write_both(tmp_path, table))
+
+def test_refuses_data_without_wind_or_zone(tmp_path):
+    bin_path = str(tmp_path / "india_data.bin")
+    with pytest.raises(ValueError):
+        write_binary({"Kerala": {"Kochi": {"max": 38, "min": 20}}}, bin_path)
+    assert not os.path.exists(bin_path)
+
+def test_parked_rebuild_is_promoted_on_open(tmp_path):
+    json_path, bin_path = write_both(tmp_path, TABLE)
+    os.replace(bin_path, pending_path(bin_path))
+    store = BinaryLocationStore(bin_path)
+    assert store.source_path == bin_path
+    assert not os.path.exists(pending_path(bin_path))
+    assert store.get("Kerala", "Kochi")["wind"] == 39
+    store.close()
+
+def test_rejects_other_files(tmp_path):
+    path = str(tmp_path / "india_data.bin")
+    with open(path, "wb") as f:
+        f.write(b"SQLite format 3\x00" + bytes(64))
+    with pytest.raises(ValueError):
+        BinaryLocationStore(path)
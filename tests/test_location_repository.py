@@ -0,0 +1,39 @@
+"""
+write_locations keeps osdag.db in step with a rebuilt table.
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from utils.location_repository import LocationRepository, write_locations
+
+TABLE = {
+    "Kerala": {"Kochi": {"wind": 39, "zone": "III", "max": 38, "min": 20},
+               "Kollam": {"wind": 39, "zone": "III", "max": 37, "min": 21}},
+    "Delhi": {"New Delhi": {"wind": 47, "zone": "IV", "max": 47, "min": 1}},
+}
+
+def test_rebuild_removes_dropped_locations(tmp_path):
+    db_path = str(tmp_path / "osdag.db")
+    assert write_locations(TABLE, db_path) == (3, 0)
+
+    rebuilt = {"Kerala": {"Kochi": TABLE["Kerala"]["Kochi"], "Kollam (Quilon)": TABLE["Kerala"]["Kollam"]},
+               "Delhi": TABLE["Delhi"]}
+    assert write_locations(rebuilt, db_path) == (3, 1)
+    repo = LocationRepository(db_path)
+    assert repo.all_locations() == [("Delhi", "New Delhi"), ("Kerala", "Kochi"), ("Kerala", "Kollam (Quilon)")]
+    assert repo.get("Kerala", "Kollam (Quilon)")["wind"] == 39
+    repo.close()
+
+def test_empty_rebuild_deletes_nothing(tmp_path):
+    db_path = str(tmp_path / "osdag.db")
+    write_locations(TABLE, db_path)
+    assert write_locations({}, db_path) == (0, 0)
+    repo = LocationRepository(db_path)
+    assert len(repo.all_locations()) == 3
+    repo.close()
@@ -0,0 +1,121 @@
+"""
+Project files (utils/project.py) and their MessagePack encoding
+(utils/binary_pack.py): round trips, the autosave journal, recovery from a
+torn frame and compaction.
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from utils.binary_pack import pack, unpack
+from utils.project import (ProjectDocument, Autosaver, HEADER, FRAME,
+                           write_project, append_changes, read_project)
+
+VALUES = [
+    None, True, False, 0, 127, 128, -1, -32, -33, 255, 65536, -(1 << 63), (1 << 64) - 1,
+    0.5, -1e300, "", "Kochi", "x" * 31, "y" * 32, "z" * 300, "कोच्चि" * 20000,
+    b"", b"\x00\xff", bytes(70000), [], list(range(20)), list(range(70000)),
+    {}, {str(i): i for i in range(20)}, {"spans": [{"length": 35.0, "girders": 4}], "skew": None},
+]
+
+def test_pack_round_trip():
+    for value in VALUES:
+        assert unpack(pack(value)) == value
+
+def test_tuples_come_back_as_lists():
+    assert unpack(pack((1, (2, 3)))) == [1, [2, 3]]
+
+def test_unpack_rejects_truncated_and_trailing_data():
+    data = pack({"span": "35", "spans": [1, 2, 3]})
+    with pytest.raises(ValueError):
+        unpack(data[:-1])
+    with pytest.raises(ValueError):
+        unpack(data + b"\x00")
+    with pytest.raises(TypeError):
+        pack({1, 2})
+
+def test_autosave_journals_only_changes(tmp_path):
+    path = str(tmp_path / "bridge.osdp")
+    write_project(path, {"span": "35", "skew": "0"})
+    document = ProjectDocument.load(path)
+    autosaver = Autosaver()
+    document.update({"span": "35", "skew": "5"})
+    assert document.changed == {"skew"}
+    autosaver.autosave(document).result()
+    assert autosaver.autosave(document) is None # Nothing changed since
+    autosaver.close()
+
+    fields, frames, size = read_project(path)
+    assert fields == {"span": "35", "skew": "5"}
+    assert frames == 2
+    assert size == os.path.getsize(path)
+
+def test_torn_frame_is_dropped_and_truncated(tmp_path):
+    path = str(tmp_path / "bridge.osdp")
+    write_project(path, {"span": "35", "skew": "0"})
+    append_changes(path, {"skew": "5"})
+    good_size = os.path.getsize(path)
+    # A crash part-way through the next autosave
+    with open(path, "ab") as f:
+        f.write(FRAME.pack(100, 0) + b"\x81\xa4skew")
+
+    document = ProjectDocument.load(path)
+    assert document.fields == {"span": "35", "skew": "5"}
+    assert document.frames == 2
+    assert os.path.getsize(path) == good_size
+
+    # Later autosaves follow the last good frame
+    append_changes(path, {"span": "40"})
+    assert read_project(path)[:2] == ({"span": "40", "skew": "5"}, 3)
+
+def test_corrupt_frame_drops_everything_after_it(tmp_path):
+    path = str(tmp_path / "bridge.osdp")
+    write_project(path, {"span": "35"})
+    append_changes(path, {"span": "40"})
+    append_changes(path, {"span": "45"})
+    with open(path, "r+b") as f:
+        # Flip a byte of the first journal frame's payload
+        f.seek(HEADER.size + FRAME.size + len(pack({"span": "35"})) + FRAME.size + 1)
+        byte = f.read(1)
+        f.seek(-1, os.SEEK_CUR)
+        f.write(bytes([byte[0] ^ 0xff]))
+    assert read_project(path)[:2] == ({"span": "35"}, 1)
+
+def test_not_a_project(tmp_path):
+    path = str(tmp_path / "other.osdp")
+    with open(path, "wb") as f:
+        f.write(b"PK\x03\x04 not a project")
+    with pytest.raises(ValueError):
+        read_project(path)
+
+def test_journal_is_compacted(tmp_path):
+    path = str(tmp_path / "bridge.osdp")
+    write_project(path, {"skew": "0"})
+    document = ProjectDocument.load(path)
+    autosaver = Autosaver(compact_every=3)
+    frames = []
+    for i in range(1, 6):
+        document.update({"skew": str(i)})
+        autosaver.autosave(document).result()
+        frames.append(read_project(path)[1])
+    autosaver.close()
+    # Two journal frames, then one snapshot holding every field, then the journal again
+    assert frames == [2, 3, 1, 2, 3]
+    assert read_project(path)[0] == {"skew": "5"}
+    assert document.frames == 3
+
+def test_save_as_compacts_to_the_new_path(tmp_path):
+    document = ProjectDocument({"span": "35"})
+    autosaver = Autosaver()
+    assert autosaver.autosave(document) is None # Not saved yet
+    path = str(tmp_path / "saved.osdp")
+    autosaver.save(document, path).result()
+    autosaver.close()
+    assert read_project(path)[:2] == ({"span": "35"}, 1)
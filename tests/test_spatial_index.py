@@ -0,0 +1,90 @@
+"""
+KDTree (utils/spatial_index.py) against a brute-force nearest-neighbour
+search, and the estimates StationIndex builds on it.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import math
+import random
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from utils.spatial_index import KDTree, StationIndex, LazyStationIndex, EARTH_RADIUS_KM
+
+def great_circle_km(a, b):
+    (lat1, lon1), (lat2, lon2) = (map(math.radians, point) for point in (a, b))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+def brute_force(points, lat, lon, k):
+    return sorted((great_circle_km(point, (lat, lon)), i) for i, point in enumerate(points))[:k]
+
+def check_nearest(points, queries, k):
+    tree = KDTree(points)
+    for lat, lon in queries:
+        found = tree.nearest(lat, lon, k)
+        expected = brute_force(points, lat, lon, k)
+        assert len(found) == len(expected)
+        for (distance, i), (expected_distance, j) in zip(found, expected):
+            assert math.isclose(distance, expected_distance, rel_tol=1e-6, abs_tol=1e-6)
+            # Equally distant points may come back in either order
+            assert i == j or math.isclose(great_circle_km(points[i], (lat, lon)), expected_distance, abs_tol=1e-6)
+
+def test_nearest_matches_brute_force_over_india():
+    rng = random.Random(21)
+    points = [(rng.uniform(6, 37), rng.uniform(68, 98)) for _ in range(500)]
+    queries = [(rng.uniform(6, 37), rng.uniform(68, 98)) for _ in range(200)] + points[:20]
+    for k in (1, 4, 10):
+        check_nearest(points, queries, k)
+
+def test_nearest_across_the_antimeridian_and_poles():
+    rng = random.Random(7)
+    points = [(rng.uniform(-90, 90), rng.uniform(-180, 180)) for _ in range(300)]
+    points += [(0.0, 179.9), (0.0, -179.9), (89.9, 0.0), (89.9, 180.0)]
+    queries = [(0.0, 180.0), (0.0, -180.0), (90.0, 45.0), (-90.0, 0.0), (12.5, -179.99)]
+    check_nearest(points, queries, 4)
+
+def test_small_trees_and_duplicates():
+    assert KDTree([]).nearest(10, 70, 3) == []
+    check_nearest([(10.0, 70.0)], [(20.0, 80.0)], 3)
+    check_nearest([(10.0, 70.0)] * 5 + [(11.0, 71.0)], [(10.0, 70.0), (10.5, 70.5)], 4)
+
+def test_estimates_from_nearest_stations():
+    stations = [(10.0, 76.0, {"wind": 40, "zone": "III", "max": 38, "min": 20}),
+                (10.0, 76.2, {"wind": 44, "zone": "III", "max": 40, "min": 22}),
+                (30.0, 77.0, {"wind": 47, "zone": "V", "max": 45, "min": 2})]
+    index = StationIndex(stations, k=2)
+    filled = index.fill({"lat": 10.0, "lon": 76.1, "max": 39})
+    assert filled["zone"] == "III"
+    assert filled["wind"] == 42 # Halfway between the two nearest
+    assert filled["max"] == 39 # Kept, not estimated
+    assert sorted(filled["estimated"]) == ["min", "wind", "zone"]
+    # A station at the same spot is copied
+    assert index.fill({"lat": 30.0, "lon": 77.0})["zone"] == "V"
+
+class CountingStore:
+    def __init__(self, records):
+        self.records = records
+        self.reads = 0
+
+    def all_locations(self):
+        return list(self.records)
+
+    def get(self, state, district):
+        self.reads += 1
+        return self.records[state, district]
+
+def test_lazy_index_is_built_once_and_only_when_needed():
+    store = CountingStore({("Kerala", "Kochi"): {"wind": 39, "zone": "III", "max": 38, "min": 20,
+                                                 "lat": 9.9, "lon": 76.3}})
+    lazy = LazyStationIndex(store)
+    complete = {"wind": 44, "zone": "III", "max": 39, "min": 16, "lat": 19.1, "lon": 72.9}
+    assert lazy.fill(complete) is complete
+    assert store.reads == 0
+    assert lazy.fill({"lat": 10.0, "lon": 76.0})["wind"] == 39
+    assert lazy.fill({"lat": 10.5, "lon": 76.5})["zone"] == "III"
+    assert store.reads == 1
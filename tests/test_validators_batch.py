@@ -0,0 +1,73 @@
+"""
+Parity of the column-wise validators (utils/validators_batch.py) with the
+scalar ones in utils/validators.py over the same mixed inputs.
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from utils import validators, validators_batch
+
+MIXED = [4, 2, 1, 0, -3, 2.9, 1.5, 4.0, 30, 100, float("nan"), float("inf"), -float("inf"),
+         "4", " 5 ", "-3", "+2", "4.0", "2.5", "1e3", "", " ", "abc", "nan", "inf", "1_000"]
+
+PAIRS = [
+    (validators.validate_span, validators_batch.validate_span_batch),
+    (validators.validate_carriageway, validators_batch.validate_carriageway_batch),
+    (validators.validate_skew, validators_batch.validate_skew_batch),
+    (validators.validate_girders, validators_batch.validate_girders_batch),
+    (validators.validate_spacing, validators_batch.validate_spacing_batch),
+    (validators.validate_overhang, validators_batch.validate_overhang_batch),
+]
+
+def check_parity(values):
+    for scalar, batch in PAIRS:
+        mask, codes = batch(values)
+        texts = validators_batch.messages(codes)
+        for i, value in enumerate(values):
+            ok, message = scalar(value)
+            assert bool(mask[i]) == ok, (scalar.__name__, value)
+            # validate_carriageway returns its range message even when valid
+            if not ok or (message and scalar is not validators.validate_carriageway):
+                assert texts[i] == message, (scalar.__name__, value, texts[i], message)
+
+def test_mixed_list():
+    check_parity(MIXED)
+
+def test_clean_text_column():
+    # Every cell parses, so the one-pass fast paths are taken
+    check_parity(["4", "2", "-3", "30", "1"])
+
+def test_numeric_arrays():
+    floats = [v for v in MIXED if isinstance(v, (int, float))]
+    check_parity(np.array(floats, dtype=np.float64))
+    check_parity(np.array([4, 2, 1, 0, -3, 30], dtype=np.int64))
+
+def test_girders_reject_non_integral_text():
+    mask, codes = validators_batch.validate_girders_batch(["4.0", "4"])
+    assert mask.tolist() == [False, True]
+    assert codes[0] == validators_batch.INVALID_NUMBER
+
+def test_girders_reject_fractional_floats():
+    # As solve_layouts does: 2.9 is not truncated to 2 girders
+    assert validators.validate_girders(2.9) == (False, "Invalid number.")
+    assert validators.validate_girders(4.0) == (True, "")
+    for values in ([2.9, 4.0], np.array([2.9, 4.0])):
+        mask, codes = validators_batch.validate_girders_batch(values)
+        assert mask.tolist() == [False, True]
+        assert codes[0] == validators_batch.INVALID_NUMBER
+
+if __name__ == "__main__":
+    test_mixed_list()
+    test_clean_text_column()
+    test_numeric_arrays()
+    test_girders_reject_non_integral_text()
+    test_girders_reject_fractional_floats()
+    print("ok")
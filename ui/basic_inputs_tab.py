@@ -1,19 +1,36 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QComboBox, 
                              QGroupBox, QFormLayout, QRadioButton, QButtonGroup, 
-                             QCheckBox, QPushButton, QLineEdit, QHBoxLayout, QMessageBox, QDialog)
-from PyQt6.QtCore import Qt
-import json
-import os
+                             QCheckBox, QPushButton, QLineEdit, QHBoxLayout, QMessageBox, QDialog,
+                             QCompleter)
+from PyQt6.QtCore import Qt, QStringListModel
 from .modify_geometry_dialog import ModifyGeometryDialog
-from utils.validators import validate_span, validate_carriageway, validate_skew
+from .workers import TaskRunner
+from utils.geometry_model import GeometryModel
+from utils.shared_locations import shared_locations, loaded_shared_locations
+from utils.instrument import traced
+from utils.project_options import (STRUCTURE_TYPES, FOOTPATH_OPTIONS, STEEL_GRADES,
+                                   CONCRETE_GRADES, SEISMIC_ZONES)
 
 class BasicInputsTab(QWidget):
-    def __init__(self):
+    @traced
+    def __init__(self, locations=None):
         super().__init__()
         self.layout = QVBoxLayout(self)
         
-        # Load Data
-        self.state_data = self.load_state_data()
+        # Store loading, lookups and search run on worker threads; a newer
+        # selection drops the result of an older one
+        self.runner = TaskRunner(self)
+        # Process-wide SharedLocations and its lookup cache, set once loaded
+        self.locations = None
+        self.lookup = None
+        self.search_results = {}
+        # State / district to select once the store (resp. that state's districts) arrives
+        self.pending_state = None
+        self.pending_district = None
+        # Values from the custom loading popup, if entered
+        self.custom_loading = None
+        # Span / carriageway / skew and the girder layout, shared with the geometry dialog
+        self.geometry = GeometryModel()
         
         # 1. Structure Type
         self.create_structure_section()
@@ -29,26 +46,30 @@ class BasicInputsTab(QWidget):
         
         self.layout.addStretch()
 
-    def load_state_data(self):
-        path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "india_data.json")
-        if os.path.exists(path):
-            try:
-                with open(path, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+        # Another project window already loaded the locations: reuse them as is,
+        # otherwise load them in the background (from `locations` if preloaded)
+        shared = loaded_shared_locations()
+        if shared is not None:
+            self.on_locations_loaded(shared)
+        else:
+            self.runner.submit("locations", self.load_state_data, locations,
+                               on_result=self.on_locations_loaded)
+
+    @traced
+    def load_state_data(self, locations=None):
+        # Built once per process from data/india_data.bin (or osdag.db / the JSON)
+        return shared_locations(locations)
 
     def create_structure_section(self):
         group = QGroupBox("1. Type of Structure")
         layout = QFormLayout()
         
         self.structure_combo = QComboBox()
-        self.structure_combo.addItems(["Highway", "Other"])
+        self.structure_combo.addItems(STRUCTURE_TYPES)
         self.structure_combo.currentTextChanged.connect(self.on_structure_changed)
         
         self.other_label = QLabel("Other structures not included.")
-        self.other_label.setStyleSheet("color: red; font-weight: bold;")
+        self.other_label.setObjectName("structureWarning")
         self.other_label.setVisible(False)
         
         layout.addRow("Select Type:", self.structure_combo)
@@ -78,16 +99,30 @@ class BasicInputsTab(QWidget):
         self.loc_widget = QWidget()
         loc_layout = QFormLayout(self.loc_widget)
         
+        # Type-ahead search: "District, State" suggestions from the prefix index
+        self.input_search = QLineEdit()
+        self.input_search.setPlaceholderText("Type a district or state...")
+        self.search_model = QStringListModel(self)
+        self.search_completer = QCompleter(self.search_model, self)
+        # The index already filters and ranks, so the completer shows its list as is
+        self.search_completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.search_completer.setWidget(self.input_search)
+        self.search_completer.activated.connect(self.on_search_selected)
+        self.input_search.textEdited.connect(self.on_search_edited)
+        self.input_search.returnPressed.connect(self.on_search_return)
+
         self.combo_state = QComboBox()
         self.combo_district = QComboBox()
         
-        # Populate States
-        states = sorted(list(self.state_data.keys()))
-        self.combo_state.addItems(["Select State..."] + states)
+        # States are filled in by on_locations_loaded
+        self.combo_state.addItem("Loading locations...")
+        self.combo_state.setEnabled(False)
+        self.input_search.setEnabled(False)
         
         self.combo_state.currentTextChanged.connect(self.on_state_changed)
         self.combo_district.currentTextChanged.connect(self.on_district_changed)
         
+        loc_layout.addRow("Search:", self.input_search)
         loc_layout.addRow("State:", self.combo_state)
         loc_layout.addRow("District:", self.combo_district)
         layout.addWidget(self.loc_widget)
@@ -102,9 +137,9 @@ class BasicInputsTab(QWidget):
         self.custom_widget.setVisible(False)
         
         # Display Area (Detailed Info)
-        # Requirement: "values should be displayed in green"
+        # Requirement: "values should be displayed in green" (ui/theme.py)
         self.info_label = QLabel("Select State and District.")
-        self.info_label.setStyleSheet("color: #2E7D32; font-weight: bold; border: 1px solid #C8E6C9; padding: 10px; background: #E8F5E9;")
+        self.info_label.setObjectName("locationInfo")
         layout.addWidget(self.info_label)
         
         group.setLayout(layout)
@@ -117,7 +152,7 @@ class BasicInputsTab(QWidget):
         self.input_span = QLineEdit()
         self.input_carriageway = QLineEdit()
         self.combo_footpath = QComboBox()
-        self.combo_footpath.addItems(["None", "Single-sided", "Both"])
+        self.combo_footpath.addItems(FOOTPATH_OPTIONS)
         self.input_skew = QLineEdit()
         
         self.input_span.editingFinished.connect(self.check_span)
@@ -140,8 +175,8 @@ class BasicInputsTab(QWidget):
         group = QGroupBox("4. Material Inputs")
         layout = QFormLayout()
         
-        items_steel = ["E250", "E350", "E450"]
-        items_concrete = [f"M{i}" for i in range(25, 65, 5)]
+        items_steel = STEEL_GRADES
+        items_concrete = CONCRETE_GRADES
         
         self.combo_girder = QComboBox()
         self.combo_girder.addItems(items_steel)
@@ -169,16 +204,44 @@ class BasicInputsTab(QWidget):
         self.loc_widget.setVisible(is_city)
         self.custom_widget.setVisible(not is_city)
         if not is_city:
-            self.info_label.setText("Enter parameters manually via popup...")
+            if self.custom_loading:
+                self.show_custom_loading()
+            else:
+                self.info_label.setText("Enter parameters manually via popup...")
         else:
              self.on_district_changed(self.combo_district.currentText())
 
+    @traced
+    def on_locations_loaded(self, locations):
+        self.locations = locations
+        self.lookup = locations.lookup # Shared with every other project window
+        self.combo_state.blockSignals(True)
+        self.combo_state.clear()
+        self.combo_state.addItems(["Select State..."] + locations.states())
+        self.combo_state.blockSignals(False)
+        self.combo_state.setEnabled(True)
+        self.input_search.setEnabled(True)
+
+        state, self.pending_state = self.pending_state, None
+        if state:
+            self.select_location(state, self.pending_district)
+
+    @traced
     def on_state_changed(self, state):
         self.combo_district.blockSignals(True)
         self.combo_district.clear()
-        
-        if state in self.state_data:
-            districts = sorted(list(self.state_data[state].keys()))
+        self.combo_district.blockSignals(False)
+        self.runner.cancel("lookup")
+        if self.locations is None:
+            return
+        self.runner.submit("districts", self.locations.districts, state,
+                           on_result=self.on_districts_loaded)
+
+    @traced
+    def on_districts_loaded(self, districts):
+        self.combo_district.blockSignals(True)
+        self.combo_district.clear()
+        if districts:
             self.combo_district.addItems(["Select District..."] + districts)
             self.info_label.setText("Select District.")
         else:
@@ -186,28 +249,69 @@ class BasicInputsTab(QWidget):
             
         self.combo_district.blockSignals(False)
 
+        district, self.pending_district = self.pending_district, None
+        if district in districts:
+            self.combo_district.setCurrentText(district)
+
+    @traced
     def on_district_changed(self, district):
+        if self.lookup is None:
+            return
         state = self.combo_state.currentText()
-        if state not in self.state_data or district not in self.state_data[state]:
+        self.runner.submit("lookup", self.lookup.get, state, district,
+                           on_result=self.show_location_info)
+
+    @traced
+    def show_location_info(self, info):
+        if info is None or not self.radio_city.isChecked():
             return
-            
-        info = self.state_data[state][district]
-        
-        wind = info.get('wind', 'N/A')
-        zone = info.get('zone', 'N/A')
-        # Factor map for extra credit correctness (IS 1893)
-        factors = {"II": 0.10, "III": 0.16, "IV": 0.24, "V": 0.36}
-        zone_factor = factors.get(zone, "N/A")
-        
-        max_t = info.get('max', 'N/A')
-        min_t = info.get('min', 'N/A')
         
         # Requirement: "values automatically appear... displayed in green"
-        text = (f"Basic Wind Speed: {wind} m/s\n"
-                f"Seismic Zone: {zone} (Z = {zone_factor})\n"
-                f"Max Shade Temp: {max_t} °C\n"
-                f"Min Shade Temp: {min_t} °C")
-        self.info_label.setText(text)
+        self.info_label.setText(info.text)
+
+    @traced
+    def search_locations(self, text):
+        # Worker thread; the index is built by the first search of any window
+        return self.locations.search(text)
+
+    def on_search_edited(self, text):
+        if self.locations is None:
+            return
+        self.runner.submit("search", self.search_locations, text,
+                           on_result=self.show_search_results)
+
+    @traced
+    def show_search_results(self, matches):
+        self.search_results = {f"{district}, {state}": (state, district) for state, district in matches}
+        self.search_model.setStringList(list(self.search_results))
+        if self.search_results:
+            self.search_completer.complete()
+        else:
+            self.search_completer.popup().hide()
+
+    def on_search_return(self):
+        # Enter without picking a suggestion takes the top one
+        if self.search_results and self.input_search.text() not in self.search_results:
+            self.on_search_selected(next(iter(self.search_results)))
+
+    def on_search_selected(self, text):
+        if text not in self.search_results:
+            return
+        state, district = self.search_results[text]
+        self.input_search.setText(text)
+        self.select_location(state, district)
+
+    def select_location(self, state, district):
+        if self.locations is None:
+            # Picked up by on_locations_loaded
+            self.pending_state, self.pending_district = state, district
+            return
+        if self.combo_state.currentText() == state and self.combo_district.findText(district) > 0:
+            self.combo_district.setCurrentText(district)
+            return
+        # Picked up by on_districts_loaded
+        self.pending_district = district
+        self.combo_state.setCurrentText(state)
 
     def open_custom_table(self):
         dialog = QDialog(self)
@@ -216,7 +320,7 @@ class BasicInputsTab(QWidget):
         
         i_wind = QLineEdit()
         i_zone = QComboBox()
-        i_zone.addItems(["II", "III", "IV", "V"])
+        i_zone.addItems(SEISMIC_ZONES)
         i_max = QLineEdit()
         i_min = QLineEdit()
         
@@ -231,32 +335,97 @@ class BasicInputsTab(QWidget):
         dialog.exec()
         
     def apply_custom(self, dialog, w, z, max_t, min_t):
-        self.info_label.setText(f"Wind: {w} m/s\nZone: {z}\nMax T: {max_t} °C\nMin T: {min_t} °C")
+        self.custom_loading = {"wind": w, "zone": z, "max": max_t, "min": min_t}
+        self.show_custom_loading()
         dialog.accept()
 
+    def show_custom_loading(self):
+        c = self.custom_loading
+        self.info_label.setText(f"Wind: {c['wind']} m/s\nZone: {c['zone']}\nMax T: {c['max']} °C\nMin T: {c['min']} °C")
+
     def check_span(self):
-        valid, msg = validate_span(self.input_span.text())
+        self.geometry.set("span_text", self.input_span.text())
+        valid, msg = self.geometry.get("span_check")
         if not valid:
              QMessageBox.warning(self, "Error", msg)
 
     def check_carriageway(self):
-        valid, msg = validate_carriageway(self.input_carriageway.text())
+        self.geometry.set("carriageway_text", self.input_carriageway.text())
+        valid, msg = self.geometry.get("carriageway_check")
         if not valid:
              QMessageBox.warning(self, "Error", msg)
              
     def check_skew(self):
-        valid, msg = validate_skew(self.input_skew.text())
+        self.geometry.set("skew_text", self.input_skew.text())
+        valid, msg = self.geometry.get("skew_check")
         if msg: # Warning
              QMessageBox.warning(self, "Warning", msg)
 
     def open_geometry_dialog(self):
-        try:
-             # Clean input to ensure valid float
-            text = self.input_carriageway.text()
-            if not text:
-                 raise ValueError
-            cw = float(text)
-            dialog = ModifyGeometryDialog(cw, self)
-            dialog.exec()
-        except ValueError:
+        # Fields still being edited haven't sent editingFinished yet
+        self.geometry.update({
+            "span_text": self.input_span.text(),
+            "carriageway_text": self.input_carriageway.text(),
+            "skew_text": self.input_skew.text(),
+        })
+        if self.geometry.get("carriageway") is None:
             QMessageBox.warning(self, "Error", "Enter Carriageway Width first.")
+            return
+        dialog = ModifyGeometryDialog(self.geometry, self)
+        dialog.exec()
+
+    # Project files
+    @traced
+    def get_state(self):
+        """Every input of the tab by field name (see utils/project.py)."""
+        if self.locations is None:
+            # Still loading; keep whatever a project asked for
+            state, district = self.pending_state or "", self.pending_district or ""
+        else:
+            state = self.combo_state.currentText() if self.combo_state.currentIndex() > 0 else ""
+            district = self.combo_district.currentText() if self.combo_district.currentIndex() > 0 else ""
+            if self.pending_district:
+                district = self.pending_district
+        return {
+            "structure_type": self.structure_combo.currentText(),
+            "location_mode": "city" if self.radio_city.isChecked() else "custom",
+            "state": state,
+            "district": district,
+            "custom_loading": self.custom_loading,
+            "span": self.input_span.text(),
+            "carriageway": self.input_carriageway.text(),
+            "footpath": self.combo_footpath.currentText(),
+            "skew": self.input_skew.text(),
+            "girder_steel": self.combo_girder.currentText(),
+            "bracing_steel": self.combo_bracing.currentText(),
+            "deck_concrete": self.combo_deck.currentText(),
+            "geometry": self.geometry.layout_state(),
+        }
+
+    @traced
+    def set_state(self, state):
+        """Restores the inputs from get_state(); missing fields keep their current value."""
+        for combo, name in ((self.structure_combo, "structure_type"), (self.combo_footpath, "footpath"),
+                            (self.combo_girder, "girder_steel"), (self.combo_bracing, "bracing_steel"),
+                            (self.combo_deck, "deck_concrete")):
+            if name in state:
+                combo.setCurrentText(state[name])
+        for field, name in ((self.input_span, "span"), (self.input_carriageway, "carriageway"),
+                            (self.input_skew, "skew")):
+            if name in state:
+                field.setText(state[name])
+        self.geometry.update({
+            "span_text": self.input_span.text(),
+            "carriageway_text": self.input_carriageway.text(),
+            "skew_text": self.input_skew.text(),
+        })
+        self.geometry.restore_layout(state.get("geometry", {}))
+
+        self.custom_loading = state.get("custom_loading", self.custom_loading)
+        if state.get("location_mode") == "custom":
+            self.radio_custom.setChecked(True)
+        else:
+            self.radio_city.setChecked(True)
+        self.toggle_location_mode()
+        if state.get("state"):
+            self.select_location(state["state"], state.get("district"))
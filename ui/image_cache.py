@@ -0,0 +1,123 @@
+import os
+import threading
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QGuiApplication, QImage, QPixmap
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+
+# (asset, width, height) variants shown by the windows, in logical pixels
+APP_LOGO = ("app_icon.png", 60, 60)
+WELCOME_HERO = ("bridge_section.png", 500, 200)
+REFERENCE_IMAGE = ("bridge_section.png", 500, 500)
+STARTUP_IMAGES = [APP_LOGO, WELCOME_HERO, REFERENCE_IMAGE]
+
+class ScaleTask(QRunnable):
+    def __init__(self, cache, keys):
+        super().__init__()
+        self.cache = cache
+        self.keys = keys
+
+    def run(self):
+        for key in self.keys:
+            self.cache.scale(key)
+
+class ImageCache(QObject):
+    """
+    Shared asset images for every window. Each PNG is decoded once and each
+    (asset, width, height, device pixel ratio) variant smooth-scaled once, both
+    on a QThreadPool worker; only the QImage -> QPixmap hand-off runs on the
+    GUI thread. Widgets call bind() and get their pixmap when it is ready.
+    """
+    scaled_ready = pyqtSignal(tuple)
+
+    def __init__(self, pool=None):
+        super().__init__()
+        self.pool = pool or QThreadPool.globalInstance()
+        self.lock = threading.Lock()
+        self.images = {}   # asset -> decoded QImage, None if missing (worker threads)
+        self.scaled = {}   # key -> scaled QImage (worker threads)
+        self.pixmaps = {}  # key -> QPixmap, None if missing (GUI thread)
+        self.pending = set()
+        self.waiting = {}  # key -> [(label, missing_text)]
+        self.scaled_ready.connect(self.on_scaled)
+
+    def key(self, name, width, height, dpr):
+        return (name, width, height, round(dpr, 2))
+
+    def decode(self, name):
+        with self.lock:
+            if name in self.images:
+                return self.images[name]
+        image = QImage(os.path.join(ASSETS_DIR, name))
+        with self.lock:
+            return self.images.setdefault(name, None if image.isNull() else image)
+
+    def scale(self, key):
+        name, width, height, dpr = key
+        image = self.decode(name)
+        if image is not None:
+            # Scale to device pixels so high-DPI screens get a sharp image
+            image = image.scaled(round(width * dpr), round(height * dpr),
+                                 Qt.AspectRatioMode.KeepAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        with self.lock:
+            self.scaled[key] = image
+        self.scaled_ready.emit(key)
+
+    def request(self, keys):
+        keys = [key for key in keys if key not in self.pixmaps and key not in self.pending]
+        if keys:
+            self.pending.update(keys)
+            self.pool.start(ScaleTask(self, keys))
+
+    def preload(self, variants, dpr=None):
+        """Starts decoding and scaling (asset, width, height) variants in the background."""
+        if dpr is None:
+            dpr = QGuiApplication.instance().devicePixelRatio()
+        self.request([self.key(name, width, height, dpr) for name, width, height in variants])
+
+    def on_scaled(self, key):
+        with self.lock:
+            image = self.scaled.pop(key)
+        pixmap = None
+        if image is not None:
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(key[3])
+        self.pixmaps[key] = pixmap
+        self.pending.discard(key)
+        for label, missing_text in self.waiting.pop(key, []):
+            self.apply(label, pixmap, missing_text)
+
+    def apply(self, label, pixmap, missing_text):
+        try:
+            if pixmap is not None:
+                label.setPixmap(pixmap)
+            elif missing_text is not None:
+                label.setText(missing_text)
+        except RuntimeError:
+            pass # Label was deleted before the image was ready
+
+    def bind(self, label, name, width, height, missing_text=None):
+        """
+        Shows the (name, width, height) variant on `label`, now if it is cached,
+        otherwise as soon as the background scale finishes.
+        `missing_text` is shown instead if the asset can't be read.
+        """
+        key = self.key(name, width, height, label.devicePixelRatioF())
+        if key in self.pixmaps:
+            self.apply(label, self.pixmaps[key], missing_text)
+            return
+        self.waiting.setdefault(key, []).append((label, missing_text))
+        self.request([key])
+
+# Created on first use, after the QApplication
+shared_cache = None
+
+def image_cache():
+    global shared_cache
+    if shared_cache is None:
+        shared_cache = ImageCache()
+    return shared_cache
+
+def asset_exists(name):
+    return os.path.exists(os.path.join(ASSETS_DIR, name))
@@ -1,17 +1,30 @@
 
 import os
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, 
-                             QTabWidget, QLabel, QFrame, QGraphicsDropShadowEffect)
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap, QFont, QColor
+                             QTabWidget, QLabel, QFrame, QGraphicsDropShadowEffect,
+                             QFileDialog, QMessageBox)
+from PyQt6.QtCore import Qt, QTimer, QPoint
+from PyQt6.QtGui import QFont, QColor, QAction, QKeySequence
+from .image_cache import image_cache, REFERENCE_IMAGE
 from .basic_inputs_tab import BasicInputsTab
 from .additional_inputs_tab import AdditionalInputsTab
+from utils.instrument import traced
+from utils.project import ProjectDocument, Autosaver, export_json, PROJECT_EXTENSION
+
+WINDOW_TITLE = "Group Design"
+PROJECT_FILTER = f"OSDAG Project (*{PROJECT_EXTENSION})"
+# Changed fields are journalled to a saved project this often
+AUTOSAVE_INTERVAL_MS = 2000
+
+# Windows opened with File > New Project, kept alive until closed
+project_windows = []
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, locations=None):
         super().__init__()
-        self.setWindowTitle("Group Design")
+        self.setWindowTitle(WINDOW_TITLE)
         self.resize(1200, 800)
+        self.locations = locations
 
         # Central Widget
         central_widget = QWidget()
@@ -22,34 +35,7 @@ class MainWindow(QMainWindow):
         
         # --- Left Panel (Tabs) ---
         self.tabs = QTabWidget()
-        self.tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #CFD8DC;
-                border-radius: 8px;
-                background: white;
-            }
-            QTabBar::tab {
-                background: #F8F9FA;
-                color: #546E7A;
-                padding: 10px 20px;
-                border: 1px solid transparent;
-                border-bottom: none;
-                margin-right: 4px;
-                font-family: "Segoe UI";
-                font-weight: 500;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-            }
-            QTabBar::tab:selected {
-                background: white;
-                color: #1976D2;
-                border-bottom: 3px solid #1976D2;
-                font-weight: bold;
-            }
-            QTabBar::tab:hover {
-                background: #ECEFF1;
-            }
-        """)
+        self.tabs.setObjectName("projectTabs")
 
         # Tab Shadow
         tab_shadow = QGraphicsDropShadowEffect()
@@ -57,7 +43,7 @@ class MainWindow(QMainWindow):
         tab_shadow.setColor(QColor(0, 0, 0, 20))
         tab_shadow.setOffset(0, 4)
         self.tabs.setGraphicsEffect(tab_shadow)
-        self.basic_inputs = BasicInputsTab()
+        self.basic_inputs = BasicInputsTab(locations)
         self.additional_inputs = AdditionalInputsTab()
         
         self.tabs.addTab(self.basic_inputs, "Basic Inputs")
@@ -72,15 +58,113 @@ class MainWindow(QMainWindow):
         
         self.image_label = QLabel("Reference Image")
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setStyleSheet("background-color: white; border: 1px solid #ddd;")
+        self.image_label.setObjectName("referenceImage")
         
-        # Load Image
-        image_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "bridge_section.png")
-        if os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            self.image_label.setPixmap(pixmap.scaled(500, 500, Qt.AspectRatioMode.KeepAspectRatio))
-        else:
-            self.image_label.setText("Image not found")
+        # Load Image (usually already scaled in the background during the welcome screen)
+        image_cache().bind(self.image_label, *REFERENCE_IMAGE, missing_text="Image not found")
             
         right_layout.addWidget(self.image_label)
         main_layout.addWidget(right_panel, stretch=1)
+
+        # Project file; the inputs are collected into it on save and autosave
+        self.project = ProjectDocument()
+        self.autosaver = Autosaver()
+        self.create_file_menu()
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.timeout.connect(self.autosave)
+        self.autosave_timer.start(AUTOSAVE_INTERVAL_MS)
+
+    def create_file_menu(self):
+        menu = self.menuBar().addMenu("File")
+        for label, shortcut, slot in (
+            ("New Project", QKeySequence.StandardKey.New, self.new_project),
+            ("Open Project...", QKeySequence.StandardKey.Open, self.open_project),
+            ("Save Project", QKeySequence.StandardKey.Save, self.save_project),
+            ("Save Project As...", QKeySequence.StandardKey.SaveAs, self.save_project_as),
+            ("Export as JSON...", None, self.export_project_json),
+        ):
+            action = QAction(label, self)
+            if shortcut is not None:
+                action.setShortcut(shortcut)
+            action.triggered.connect(slot)
+            menu.addAction(action)
+
+    def new_project(self):
+        # Another window on the same shared location data; nothing is reloaded
+        window = MainWindow(self.locations)
+        window.move(self.pos() + QPoint(30, 30))
+        project_windows.append(window)
+        window.show()
+
+    def collect_inputs(self):
+        self.project.update(self.basic_inputs.get_state())
+
+    def update_title(self):
+        if self.project.path:
+            self.setWindowTitle(f"{WINDOW_TITLE} - {os.path.basename(self.project.path)}")
+        else:
+            self.setWindowTitle(WINDOW_TITLE)
+
+    @traced
+    def autosave(self):
+        # Only the changed fields leave the GUI thread; the write runs on the autosave thread
+        if self.project.path is None:
+            return
+        self.collect_inputs()
+        self.autosaver.autosave(self.project)
+
+    def save_project(self):
+        if self.project.path is None:
+            self.save_project_as()
+        else:
+            self.write_project(self.project.path)
+
+    def save_project_as(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save Project", "", PROJECT_FILTER)
+        if not path:
+            return
+        if not path.endswith(PROJECT_EXTENSION):
+            path += PROJECT_EXTENSION
+        self.write_project(path)
+
+    def write_project(self, path):
+        self.collect_inputs()
+        try:
+            # Queued behind any autosave still running, so the file ends up complete
+            self.autosaver.save(self.project, path).result()
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"Could not save the project:\n{e}")
+            return
+        self.update_title()
+
+    def open_project(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Open Project", "", PROJECT_FILTER)
+        if not path:
+            return
+        try:
+            project = ProjectDocument.load(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Error", f"Could not open the project:\n{e}")
+            return
+        self.autosave() # Flush the current project first
+        self.project = project
+        self.basic_inputs.set_state(project.fields)
+        self.update_title()
+
+    def export_project_json(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Project", "", "JSON (*.json)")
+        if not path:
+            return
+        self.collect_inputs()
+        try:
+            export_json(self.project.fields, path)
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"Could not export the project:\n{e}")
+
+    def closeEvent(self, event):
+        self.autosave_timer.stop()
+        self.autosave()
+        self.autosaver.close()
+        if self in project_windows:
+            project_windows.remove(self)
+        super().closeEvent(event)
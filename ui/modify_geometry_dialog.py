@@ -1,24 +1,56 @@
 from PyQt6.QtWidgets import (QDialog, QFormLayout, QLineEdit, QPushButton, 
-                             QMessageBox, QVBoxLayout, QLabel)
-from utils.geometry_calculator import calculate_girders, calculate_spacing
+                             QMessageBox, QVBoxLayout, QLabel, QComboBox)
+from utils.layout_enumerator import enumerate_layouts
+from .workers import TaskRunner
+from utils.instrument import traced
+
+@traced
+def take_layouts(stream, count, is_cancelled=None):
+    layouts = []
+    for layout in stream:
+        if is_cancelled is not None and is_cancelled():
+            break
+        layouts.append(layout)
+        if len(layouts) >= count:
+            break
+    return layouts
 
 class ModifyGeometryDialog(QDialog):
-    def __init__(self, carriageway_width, parent=None):
+    # Suggestions shown straight away, the rest up to the cap from a worker thread
+    FIRST_LAYOUTS = 5
+    MAX_LAYOUTS = 200
+
+    @traced
+    def __init__(self, model, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Modify Additional Geometry")
         self.resize(350, 250)
-        self.cw = carriageway_width
-        self.overall_width = self.cw + 5.0  # Rule: Width = CW + 5m
+        # Shared GeometryModel; girders and spacing are derived nodes of its graph
+        self.model = model
+        self.overall_width = model.get("overall_width")  # Rule: Width = CW + 5m
+        # Layout enumeration runs off the GUI thread. Spacing / girder / overhang
+        # rebalancing used to be worker tasks too; it is now a few arithmetic
+        # nodes of the model, recomputed inline when read. Anything slow that
+        # comes to depend on the layout (e.g. design checks) goes through the runner.
+        self.runner = TaskRunner(self)
         
         self.layout = QVBoxLayout(self)
         
         # Info
         info_label = QLabel(f"Overall Width: {self.overall_width:.2f} m\n(Carriageway + 5m)")
-        info_label.setStyleSheet("font-weight: bold; margin-bottom: 10px;")
+        info_label.setObjectName("geometryInfo")
         self.layout.addWidget(info_label)
         
         form_layout = QFormLayout()
         
+        # Ranked feasible layouts, streamed from the enumerator
+        self.combo_layouts = QComboBox()
+        self.combo_layouts.addItem("Select a suggested layout...")
+        self.combo_layouts.activated.connect(self.on_layout_selected)
+        form_layout.addRow("Suggested Layouts:", self.combo_layouts)
+        self.layouts = []
+        self.layout_stream = enumerate_layouts(model.get("carriageway"), model.get("span"))
+        
         self.inp_spacing = QLineEdit()
         self.inp_girders = QLineEdit()
         self.inp_overhang = QLineEdit()
@@ -30,48 +62,82 @@ class ModifyGeometryDialog(QDialog):
         self.layout.addLayout(form_layout)
         
         # Initial Values
-        self.inp_girders.setText("4")
-        self.inp_overhang.setText("1.0")
-        # Calc initial spacing
-        s = calculate_spacing(self.overall_width, 4, 1.0)
-        self.inp_spacing.setText(f"{s:.2f}")
+        self.show_girders(model.get("girders"))
+        self.show_spacing(model.get("spacing"))
+        self.inp_overhang.setText(str(model.get("overhang")))
         
-        # Signals
+        # Signals: edits go into the model, derived values come back through observers
         self.inp_spacing.editingFinished.connect(self.on_spacing_changed)
         self.inp_girders.editingFinished.connect(self.on_girders_changed)
         self.inp_overhang.editingFinished.connect(self.on_overhang_changed)
+        self.observers = [
+            model.observe("girders", self.show_girders),
+            model.observe("spacing", self.show_spacing),
+        ]
         
         btn_close = QPushButton("Close")
         btn_close.clicked.connect(self.accept)
         self.layout.addWidget(btn_close)
+        
+        # Best candidates now, the rest in the background
+        self.add_layouts(take_layouts(self.layout_stream, self.FIRST_LAYOUTS))
+        if len(self.layouts) == self.FIRST_LAYOUTS:
+            self.runner.submit("layouts", take_layouts, self.layout_stream,
+                               self.MAX_LAYOUTS - self.FIRST_LAYOUTS,
+                               cancellable=True, on_result=self.add_layouts)
+
+    @traced
+    def add_layouts(self, layouts):
+        for layout in layouts:
+            self.layouts.append(layout)
+            self.combo_layouts.addItem(
+                f"{layout['girders']} girders @ {layout['spacing']:.2f} m, overhang {layout['overhang']:.2f} m")
+
+    def done(self, result):
+        # Nothing left to show once the dialog closes
+        self.runner.cancel_all()
+        for handle in self.observers:
+            self.model.unobserve(handle)
+        self.observers = []
+        super().done(result)
 
+    def show_girders(self, girders):
+        if girders is not None:
+            self.inp_girders.setText(str(girders))
+
+    def show_spacing(self, spacing):
+        if spacing is not None:
+            self.inp_spacing.setText(f"{spacing:.2f}")
+
+    @traced
+    def on_layout_selected(self, index):
+        if index <= 0:
+            return
+        layout = self.layouts[index - 1]
+        self.inp_overhang.setText(f"{layout['overhang']:.2f}")
+        self.model.apply_layout(layout)
+
+    @traced
     def on_spacing_changed(self):
         # If spacing changes -> update girders
         try:
             S = float(self.inp_spacing.text())
-            O = float(self.inp_overhang.text())
             if S <= 0: return
-            
-            # Recalc Girders
-            N = calculate_girders(self.overall_width, S, O)
-            self.inp_girders.setText(str(N))
-            
+            self.model.set_spacing(S)
         except ValueError:
             pass
 
+    @traced
     def on_girders_changed(self):
         # If girders changes -> update spacing
         try:
             N = int(self.inp_girders.text())
-            O = float(self.inp_overhang.text())
             if N <= 0: return
-            
-            S = calculate_spacing(self.overall_width, N, O)
-            self.inp_spacing.setText(f"{S:.2f}")
-            
+            self.model.set_girders(N)
         except ValueError:
             pass
 
+    @traced
     def on_overhang_changed(self):
         # If overhang changes -> update both
         # Logic: 1. Calc closest Girders (N), 2. Calc exact Spacing (S) for that N
@@ -81,15 +147,6 @@ class ModifyGeometryDialog(QDialog):
                 S_old = float(self.inp_spacing.text())
             except ValueError:
                 S_old = 1.0 # default
-                
-            # 1. Update Girders based on old spacing and new overhang
-            N = calculate_girders(self.overall_width, S_old, O)
-            if N <= 0: N = 1 # Avoid div by zero
-            self.inp_girders.setText(str(N))
-            
-            # 2. Update Spacing to fit exactly
-            S_new = calculate_spacing(self.overall_width, N, O)
-            self.inp_spacing.setText(f"{S_new:.2f}")
-            
+            self.model.set_overhang(O, S_old)
         except ValueError:
             pass
@@ -0,0 +1,258 @@
+"""
+Application theme: one stylesheet, parsed once and applied to the QApplication.
+
+Widgets that need their own look get an objectName (or a dynamic property)
+here instead of calling setStyleSheet themselves; every per-widget sheet makes
+Qt parse CSS again and re-polish that widget's whole subtree.
+"""
+
+# Global Stylesheet (Custom Color Code)
+BASE = """
+    QMainWindow {
+        background-color: white;
+    }
+
+    /* 1. Informational Points: see #locationInfo below */
+
+    /* 2. Dropdowns are Blue */
+    QComboBox {
+        border: 2px solid #1976D2; /* Blue Border */
+        border-radius: 4px;
+        padding: 5px;
+        background: white;
+        color: black;
+    }
+    /* Labels */
+    QLabel {
+        color: black;
+    }
+    QWidget {
+        color: black;
+    }
+    QComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 25px;
+        border-left-width: 1px;
+        border-left-color: #1976D2;
+        border-left-style: solid;
+        border-top-right-radius: 3px;
+        border-bottom-right-radius: 3px;
+        background: white; /* White BG for arrow area */
+    }
+    QComboBox QAbstractItemView {
+        background: white;
+        selection-background-color: #E3F2FD;
+        selection-color: black;
+    }
+    QComboBox:on { /* shift the text when the popup opens */
+        padding-top: 3px;
+        padding-left: 4px;
+    }
+
+    /* 3. Checkboxes are Orange */
+    QCheckBox {
+        spacing: 5px;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border: 2px solid #F57C00; /* Orange Border */
+        border-radius: 3px;
+        background: white;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #F57C00; /* Orange Fill */
+        image: url(none); /* In real app custom checkmark, standard is fine */
+        border: 2px solid #E65100;
+    }
+    QRadioButton::indicator { /* Applying to Radio too as layout often groups them */
+        width: 18px;
+        height: 18px;
+        border: 2px solid #F57C00;
+        border-radius: 10px;
+        background: white;
+    }
+    QRadioButton::indicator:checked {
+        background-color: #F57C00;
+    }
+
+    /* 4. Pop-up dialog boxes are Yellow */
+    QDialog {
+        background-color: #FFFDE7; /* Light Yellow Background */
+    }
+    /* Buttons */
+    QPushButton {
+        background-color: #FFFFFF;
+        border: 1px solid #B0BEC5;
+        border-bottom: 3px solid #B0BEC5; /* Pseudo-3D effect */
+        border-radius: 6px;
+        padding: 6px 16px;
+        color: #455A64;
+        font-weight: bold;
+        font-family: "Segoe UI";
+    }
+    QPushButton:hover {
+        background-color: #F1F8E9; /* Slight Green tint for action */
+        border-color: #81C784;
+        border-bottom-color: #66BB6A;
+        color: #2E7D32;
+        margin-top: 1px; /* Press effect simulation */
+        border-bottom-width: 2px;
+    }
+    QPushButton:pressed {
+        background-color: #DCEDC8;
+        margin-top: 3px;
+        border-bottom-width: 0px;
+    }
+
+    /* Text Inputs */
+    QLineEdit {
+        border: 1px solid #999;
+        border-radius: 4px;
+        padding: 5px;
+        background: white;
+    }
+    QLineEdit:focus {
+        border: 2px solid #1976D2;
+    }
+
+    /* Tabs (Keeping clean) */
+    QTabWidget::pane {
+        border: 1px solid #CCC;
+        background: white;
+    }
+    QTabBar::tab {
+        background: #EEE;
+        padding: 8px 20px;
+        border: 1px solid #CCC;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background: white;
+        border-bottom: 2px solid #1976D2; /* Blue accent */
+    }
+"""
+
+# Object name -> rules for that widget. ID selectors outrank the BASE type
+# selectors, so these win exactly as the old per-widget sheets did.
+WELCOME_RULES = {
+    "welcomeContent": """
+        QWidget#welcomeContent { background-color: #FFFFFF; }
+    """,
+    "welcomeTitle": """
+        QLabel#welcomeTitle { color: #1A237E; letter-spacing: -2px; }
+    """,
+    "welcomeSubtitle": """
+        QLabel#welcomeSubtitle { color: #37474F; }
+    """,
+    "welcomeDescription": """
+        QLabel#welcomeDescription { color: #78909C; line-height: 150%; }
+    """,
+    "welcomeFooter": """
+        QLabel#welcomeFooter { color: #B0BEC5; }
+    """,
+    "startButton": """
+        QPushButton#startButton {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                        stop:0 #2962FF, stop:1 #2979FF);
+            color: white;
+            border-radius: 8px;
+            border: none;
+            padding-left: 25px;
+            text-align: left;
+        }
+        QPushButton#startButton:hover {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                        stop:0 #448AFF, stop:1 #2962FF);
+            padding-left: 30px; /* Slide effect */
+        }
+        QPushButton#startButton:pressed {
+            background: #1565C0;
+        }
+    """,
+    # Deep Engineering Blue Gradient
+    "welcomeHero": """
+        QFrame#welcomeHero {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                                        stop:0 #0D47A1, stop:1 #1565C0);
+        }
+    """,
+    # Glass card, or a white box behind the diagram when the image exists
+    "heroCard": """
+        QFrame#heroCard {
+            background: rgba(255, 255, 255, 10);
+            border: 1px solid rgba(255, 255, 255, 30);
+            border-radius: 20px;
+        }
+        QFrame#heroCard[hasImage="true"] {
+            background: white;
+            border: none;
+        }
+    """,
+    "heroImage": """
+        QLabel#heroImage { background: transparent; border: none; }
+    """,
+}
+
+MAIN_WINDOW_RULES = {
+    "projectTabs": """
+        QTabWidget#projectTabs::pane {
+            border: 1px solid #CFD8DC;
+            border-radius: 8px;
+            background: white;
+        }
+        QTabWidget#projectTabs QTabBar::tab {
+            background: #F8F9FA;
+            color: #546E7A;
+            padding: 10px 20px;
+            border: 1px solid transparent;
+            border-bottom: none;
+            margin-right: 4px;
+            font-family: "Segoe UI";
+            font-weight: 500;
+            border-top-left-radius: 6px;
+            border-top-right-radius: 6px;
+        }
+        QTabWidget#projectTabs QTabBar::tab:selected {
+            background: white;
+            color: #1976D2;
+            border-bottom: 3px solid #1976D2;
+            font-weight: bold;
+        }
+        QTabWidget#projectTabs QTabBar::tab:hover {
+            background: #ECEFF1;
+        }
+    """,
+    "referenceImage": """
+        QLabel#referenceImage { background-color: white; border: 1px solid #ddd; }
+    """,
+}
+
+INPUT_RULES = {
+    "structureWarning": """
+        QLabel#structureWarning { color: red; font-weight: bold; }
+    """,
+    # Requirement: "values should be displayed in green"
+    "locationInfo": """
+        QLabel#locationInfo {
+            color: #2E7D32;
+            font-weight: bold;
+            border: 1px solid #C8E6C9;
+            padding: 10px;
+            background: #E8F5E9;
+        }
+    """,
+    "geometryInfo": """
+        QLabel#geometryInfo { font-weight: bold; margin-bottom: 10px; }
+    """,
+}
+
+WIDGET_RULES = {**WELCOME_RULES, **MAIN_WINDOW_RULES, **INPUT_RULES}
+
+def build_stylesheet():
+    return "\n".join([BASE] + list(WIDGET_RULES.values()))
+
+def apply_theme(app):
+    """Sets the consolidated stylesheet once, before any window is built."""
+    app.setStyleSheet(build_stylesheet())
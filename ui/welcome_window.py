@@ -1,8 +1,8 @@
-import os
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton, 
                              QFrame, QHBoxLayout, QGraphicsDropShadowEffect, QSizePolicy)
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QColor, QPixmap
+from PyQt6.QtGui import QFont, QColor
+from .image_cache import image_cache, asset_exists, APP_LOGO, WELCOME_HERO
 
 class WelcomeWindow(QMainWindow):
     def __init__(self):
@@ -23,7 +23,7 @@ class WelcomeWindow(QMainWindow):
         # LEFT PANEL: Clean, Typography-focused
         # ==========================================================
         left_panel = QWidget()
-        left_panel.setStyleSheet("background-color: #FFFFFF;")
+        left_panel.setObjectName("welcomeContent")
         left_layout = QVBoxLayout(left_panel)
         left_layout.setContentsMargins(60, 60, 60, 60)
         left_layout.setSpacing(10)
@@ -31,10 +31,8 @@ class WelcomeWindow(QMainWindow):
         # 1. Logo (Small, Top Left)
         logo_label = QLabel()
         logo_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "app_icon.png")
-        if os.path.exists(icon_path):
-            pix = QPixmap(icon_path)
-            logo_label.setPixmap(pix.scaled(60, 60, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        # Decoded and scaled off the GUI thread by the shared image cache
+        image_cache().bind(logo_label, *APP_LOGO)
         left_layout.addWidget(logo_label)
         
         left_layout.addSpacing(30)
@@ -42,13 +40,13 @@ class WelcomeWindow(QMainWindow):
         # 2. Main Title (Huge & Bold)
         title_top = QLabel("OSDAG")
         title_top.setFont(QFont("Segoe UI Black", 56, QFont.Weight.Bold))
-        title_top.setStyleSheet("color: #1A237E; letter-spacing: -2px;")
+        title_top.setObjectName("welcomeTitle")
         left_layout.addWidget(title_top)
         
         # 3. Subtitle (Light & Modern)
         title_sub = QLabel("Group Design")
         title_sub.setFont(QFont("Segoe UI Light", 48, QFont.Weight.Light))
-        title_sub.setStyleSheet("color: #37474F;")
+        title_sub.setObjectName("welcomeSubtitle")
         left_layout.addWidget(title_sub)
         
         left_layout.addSpacing(20)
@@ -57,7 +55,7 @@ class WelcomeWindow(QMainWindow):
         desc_label = QLabel("Interactive Steel Structure Design Module for Civil Engineers.")
         desc_label.setWordWrap(True)
         desc_label.setFont(QFont("Segoe UI", 12))
-        desc_label.setStyleSheet("color: #78909C; line-height: 150%;")
+        desc_label.setObjectName("welcomeDescription")
         left_layout.addWidget(desc_label)
         
         left_layout.addStretch()
@@ -68,26 +66,8 @@ class WelcomeWindow(QMainWindow):
         self.start_btn.setFixedSize(280, 70)
         self.start_btn.setFont(QFont("Segoe UI Semibold", 13, QFont.Weight.DemiBold))
         
-        # Gradient & Shadow for Button
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #2962FF, stop:1 #2979FF);
-                color: white;
-                border-radius: 8px;
-                border: none;
-                padding-left: 25px;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                            stop:0 #448AFF, stop:1 #2962FF);
-                padding-left: 30px; /* Slide effect */
-            }
-            QPushButton:pressed {
-                background: #1565C0;
-            }
-        """)
+        # Gradient (ui/theme.py) & Shadow for Button
+        self.start_btn.setObjectName("startButton")
         
         # Button Shadow
         btn_shadow = QGraphicsDropShadowEffect()
@@ -103,7 +83,7 @@ class WelcomeWindow(QMainWindow):
         # 6. Footer
         footer = QLabel("v1.0.0  •  Department of Civil Engineering")
         footer.setFont(QFont("Segoe UI", 9))
-        footer.setStyleSheet("color: #B0BEC5;")
+        footer.setObjectName("welcomeFooter")
         left_layout.addWidget(footer)
         
         # ==========================================================
@@ -111,12 +91,7 @@ class WelcomeWindow(QMainWindow):
         # ==========================================================
         right_panel = QFrame()
         # Deep Engineering Blue Gradient
-        right_panel.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                            stop:0 #0D47A1, stop:1 #1565C0);
-            }
-        """)
+        right_panel.setObjectName("welcomeHero")
         right_layout = QVBoxLayout(right_panel)
         right_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         right_layout.setContentsMargins(40, 40, 40, 40)
@@ -124,29 +99,20 @@ class WelcomeWindow(QMainWindow):
         # Hero Image Container (Floating)
         img_container = QFrame()
         img_container.setFixedSize(600, 300)
-        img_container.setStyleSheet("""
-            background: rgba(255, 255, 255, 10); /* Glass effect */
-            border: 1px solid rgba(255, 255, 255, 30);
-            border-radius: 20px;
-        """)
+        img_container.setObjectName("heroCard") # Glass effect
         
         img_layout = QVBoxLayout(img_container)
         img_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # Hero Image
         hero_img = QLabel()
-        hero_img.setStyleSheet("background: transparent; border: none;")
-        image_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "bridge_section.png")
-        if os.path.exists(image_path):
-            pix = QPixmap(image_path)
+        hero_img.setObjectName("heroImage")
+        if asset_exists(WELCOME_HERO[0]):
             # Invert colors not easily possible without PIL/Opencv in raw qt efficiently here
             # We will display the diagram as is, assuming it contrasts okay or putting it in a white box
             # Actually, let's put it in a white box for clarity
-            img_container.setStyleSheet("""
-                background: white;
-                border-radius: 20px;
-            """)
-            hero_img.setPixmap(pix.scaled(500, 200, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            img_container.setProperty("hasImage", True)
+            image_cache().bind(hero_img, *WELCOME_HERO)
         
         # Hero Shadow
         hero_shadow = QGraphicsDropShadowEffect()
@@ -0,0 +1,105 @@
+import threading
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# Workers between pool.start() and the end of run(), so none is freed while
+# the pool still holds it even if its TaskRunner goes away first
+in_flight = set()
+
+class WorkerSignals(QObject):
+    # (worker, result) / (worker, error message); queued to the GUI thread
+    finished = pyqtSignal(object, object)
+    failed = pyqtSignal(object, str)
+
+class Worker(QRunnable):
+    """
+    Runs fn(*args, **kwargs) on a QThreadPool thread and reports through
+    `signals`. Cancelling skips a worker that hasn't started yet; with
+    cancellable=True, fn also gets an `is_cancelled` callable to poll.
+    """
+    def __init__(self, fn, *args, cancellable=False, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False) # Owned by Python, see in_flight
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        if cancellable:
+            self.kwargs["is_cancelled"] = self.is_cancelled
+        self.cancelled = threading.Event()
+        self.signals = WorkerSignals()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def is_cancelled(self):
+        return self.cancelled.is_set()
+
+    def start(self, pool):
+        in_flight.add(self)
+        pool.start(self)
+
+    def run(self):
+        try:
+            if self.is_cancelled():
+                self.signals.finished.emit(self, None)
+                return
+            try:
+                result = self.fn(*self.args, **self.kwargs)
+            except Exception as e:
+                self.signals.failed.emit(self, str(e))
+                return
+            self.signals.finished.emit(self, result)
+        finally:
+            in_flight.discard(self)
+
+class TaskRunner(QObject):
+    """
+    Submits Workers for a widget, one slot per task name. A new submission
+    under the same name cancels the previous one and bumps its generation, so
+    a result that arrives after the user moved on is dropped, not shown.
+    Callbacks always run on the GUI thread.
+    """
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self.generations = {}
+        self.workers = {} # worker -> (name, generation, on_result, on_error)
+
+    def submit(self, name, fn, *args, on_result=None, on_error=None, cancellable=False, **kwargs):
+        self.cancel(name)
+        generation = self.generations.get(name, 0)
+        worker = Worker(fn, *args, cancellable=cancellable, **kwargs)
+        worker.signals.finished.connect(self.on_finished)
+        worker.signals.failed.connect(self.on_failed)
+        self.workers[worker] = (name, generation, on_result, on_error)
+        worker.start(self.pool)
+        return worker
+
+    def is_current(self, name, generation):
+        return self.generations.get(name, 0) == generation
+
+    def cancel(self, name):
+        """Drops any pending result for `name` and cancels its worker."""
+        self.generations[name] = self.generations.get(name, 0) + 1
+        for worker, (task, _, _, _) in self.workers.items():
+            if task == name:
+                worker.cancel()
+
+    def cancel_all(self):
+        for name in list(self.generations):
+            self.cancel(name)
+
+    def on_finished(self, worker, result):
+        name, generation, on_result, _ = self.workers.pop(worker, (None, None, None, None))
+        if name is None or worker.is_cancelled() or not self.is_current(name, generation):
+            return # Stale
+        if on_result is not None:
+            on_result(result)
+
+    def on_failed(self, worker, message):
+        name, generation, _, on_error = self.workers.pop(worker, (None, None, None, None))
+        if name is None or worker.is_cancelled() or not self.is_current(name, generation):
+            return
+        if on_error is not None:
+            on_error(message)
+        else:
+            print(f"Background task '{name}' failed: {message}")
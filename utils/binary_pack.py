@@ -0,0 +1,143 @@
+"""
+Minimal MessagePack encoder/decoder (stdlib only) for project files.
+
+Covers None, bool, int, float, str, bytes, list/tuple and dict, which is all a
+project document holds. The output is standard MessagePack, so other tools can
+read it; tuples come back as lists.
+"""
+import struct
+
+def pack(obj):
+    out = bytearray()
+    pack_into(out, obj)
+    return bytes(out)
+
+def pack_length(out, n, small_tag, small_limit, tags):
+    # tags: 8/16/32-bit length markers (None where the type has no 8-bit form)
+    if n < small_limit:
+        out.append(small_tag | n)
+    elif n < 0x100 and tags[0] is not None:
+        out += struct.pack(">BB", tags[0], n)
+    elif n < 0x10000:
+        out += struct.pack(">BH", tags[1], n)
+    elif n < 0x100000000:
+        out += struct.pack(">BI", tags[2], n)
+    else:
+        raise ValueError("Object too large to pack")
+
+def pack_into(out, obj):
+    if obj is None:
+        out.append(0xc0)
+    elif obj is True:
+        out.append(0xc3)
+    elif obj is False:
+        out.append(0xc2)
+    elif isinstance(obj, int):
+        if 0 <= obj < 0x80:
+            out.append(obj)
+        elif -32 <= obj < 0:
+            out.append(obj & 0xff)
+        elif -(1 << 63) <= obj < (1 << 63):
+            out += struct.pack(">Bq", 0xd3, obj)
+        elif 0 <= obj < (1 << 64):
+            out += struct.pack(">BQ", 0xcf, obj)
+        else:
+            raise ValueError("Integer too large to pack")
+    elif isinstance(obj, float):
+        out += struct.pack(">Bd", 0xcb, obj)
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8")
+        pack_length(out, len(data), 0xa0, 32, (0xd9, 0xda, 0xdb))
+        out += data
+    elif isinstance(obj, (bytes, bytearray)):
+        pack_length(out, len(obj), 0, 0, (0xc4, 0xc5, 0xc6))
+        out += obj
+    elif isinstance(obj, (list, tuple)):
+        pack_length(out, len(obj), 0x90, 16, (None, 0xdc, 0xdd))
+        for item in obj:
+            pack_into(out, item)
+    elif isinstance(obj, dict):
+        pack_length(out, len(obj), 0x80, 16, (None, 0xde, 0xdf))
+        for key, value in obj.items():
+            pack_into(out, key)
+            pack_into(out, value)
+    else:
+        raise TypeError(f"Can't pack {type(obj).__name__}")
+
+# Fixed-size values: tag -> (struct format, size)
+FIXED = {
+    0xca: (">f", 4), 0xcb: (">d", 8),
+    0xcc: (">B", 1), 0xcd: (">H", 2), 0xce: (">I", 4), 0xcf: (">Q", 8),
+    0xd0: (">b", 1), 0xd1: (">h", 2), 0xd2: (">i", 4), 0xd3: (">q", 8),
+}
+# Length-prefixed values: tag -> (kind, length format, size)
+SIZED = {
+    0xd9: ("str", ">B", 1), 0xda: ("str", ">H", 2), 0xdb: ("str", ">I", 4),
+    0xc4: ("bin", ">B", 1), 0xc5: ("bin", ">H", 2), 0xc6: ("bin", ">I", 4),
+    0xdc: ("array", ">H", 2), 0xdd: ("array", ">I", 4),
+    0xde: ("map", ">H", 2), 0xdf: ("map", ">I", 4),
+}
+
+def unpack(data):
+    """Decodes one packed object; raises ValueError on truncated or trailing data."""
+    data = bytes(data)
+    try:
+        obj, pos = unpack_from(data, 0)
+    except (IndexError, struct.error):
+        raise ValueError("Truncated packed data")
+    if pos != len(data):
+        raise ValueError("Trailing bytes after packed data")
+    return obj
+
+def read(data, pos, size):
+    if pos + size > len(data):
+        raise IndexError
+    return data[pos:pos + size], pos + size
+
+def unpack_from(data, pos):
+    tag = data[pos]
+    pos += 1
+    if tag < 0x80:
+        return tag, pos
+    if tag >= 0xe0:
+        return tag - 0x100, pos
+    if tag <= 0x8f:
+        return unpack_map(data, pos, tag & 0x0f)
+    if tag <= 0x9f:
+        return unpack_array(data, pos, tag & 0x0f)
+    if tag <= 0xbf:
+        raw, pos = read(data, pos, tag & 0x1f)
+        return raw.decode("utf-8"), pos
+    if tag == 0xc0:
+        return None, pos
+    if tag in (0xc2, 0xc3):
+        return tag == 0xc3, pos
+    if tag in FIXED:
+        fmt, size = FIXED[tag]
+        return struct.unpack_from(fmt, data, pos)[0], pos + size
+    if tag in SIZED:
+        kind, fmt, size = SIZED[tag]
+        n = struct.unpack_from(fmt, data, pos)[0]
+        pos += size
+        if kind == "map":
+            return unpack_map(data, pos, n)
+        if kind == "array":
+            return unpack_array(data, pos, n)
+        raw, pos = read(data, pos, n)
+        return (raw.decode("utf-8") if kind == "str" else raw), pos
+    raise ValueError(f"Unsupported packed type 0x{tag:02x}")
+
+def unpack_array(data, pos, n):
+    items = []
+    for _ in range(n):
+        item, pos = unpack_from(data, pos)
+        items.append(item)
+    return items, pos
+
+def unpack_map(data, pos, n):
+    result = {}
+    for _ in range(n):
+        key, pos = unpack_from(data, pos)
+        value, pos = unpack_from(data, pos)
+        result[key] = value
+    return result, pos
@@ -0,0 +1,88 @@
+import re
+from collections import defaultdict
+from fuzzywuzzy import fuzz
+from fuzzywuzzy.utils import full_process
+
+NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+def normalise(name):
+    # Same normalisation fuzzywuzzy applies before scoring (lowercase, alphanumerics only)
+    return NON_ALNUM.sub(' ', name.lower()).strip()
+
+def trigrams(name):
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class CityMatcher:
+    """
+    Trigram-blocked fuzzy index over a list of city names.
+    Built once per flat table; each query only scores the `candidates` names
+    closest to it by trigram overlap instead of the whole list.
+    """
+    def __init__(self, names, candidates=32):
+        self.names = list(names)
+        self.candidates = candidates
+        self.exact_ids = {}
+        self.index = defaultdict(list)
+        self.gram_counts = []
+        for i, name in enumerate(self.names):
+            key = normalise(name)
+            processed = full_process(name, force_ascii=True)
+            if processed:
+                self.exact_ids.setdefault(processed, i)
+            grams = trigrams(key)
+            self.gram_counts.append(len(grams))
+            for gram in grams:
+                self.index[gram].append(i)
+
+    def ranked_ids(self, key):
+        grams = trigrams(key)
+        counts = defaultdict(int)
+        for gram in grams:
+            for i in self.index.get(gram, ()):
+                counts[i] += 1
+        # Dice overlap, so long names sharing a short query's trigrams don't crowd out near-spellings
+        total = len(grams)
+        similarity = {i: 2 * count / (total + self.gram_counts[i]) for i, count in counts.items()}
+        return sorted(similarity, key=similarity.get, reverse=True)
+
+    def candidate_ids(self, key):
+        return self.ranked_ids(key)[:self.candidates]
+
+    def matches(self, query, threshold=60, limit=10):
+        """Returns up to `limit` (name, score) pairs scoring >= threshold, best first."""
+        key = normalise(query)
+        if not key:
+            return []
+        scored = [(fuzz.WRatio(query, self.names[i]), self.names[i]) for i in self.candidate_ids(key)]
+        scored.sort(key=lambda pair: -pair[0])
+        return [(name, score) for score, name in scored if score >= threshold][:limit]
+
+    def best_of(self, query, ids):
+        # Highest WRatio, the earliest name winning ties as in process.extractOne
+        best, best_score = None, -1
+        for i in ids:
+            score = fuzz.WRatio(query, self.names[i])
+            if score > best_score:
+                best, best_score = self.names[i], score
+        return best, best_score
+
+    def best_match(self, query, threshold=90):
+        """
+        Returns (name, score) of the best match scoring >= threshold, else None.
+        Scores with fuzz.WRatio, the scorer process.extractOne uses, but only the
+        `candidates` names closest by trigrams; when none of them reaches the
+        threshold, the next `candidates * 3` are tried before giving up.
+        """
+        # WRatio is 100 exactly when both sides process to the same text
+        exact = self.exact_ids.get(full_process(query, force_ascii=True))
+        if exact is not None:
+            return self.names[exact], 100
+
+        ranked = self.ranked_ids(normalise(query))
+        best, best_score = self.best_of(query, sorted(ranked[:self.candidates]))
+        if best_score < threshold:
+            best, best_score = self.best_of(query, sorted(ranked[self.candidates:self.candidates * 4]))
+        if best is not None and best_score >= threshold:
+            return best, best_score
+        return None
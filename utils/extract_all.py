@@ -1,73 +1,213 @@
 import os
+import sys
+import argparse
 import fitz # PyMuPDF
 import json
 import re
-from fuzzywuzzy import process
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR) # allow `python utils/extract_all.py`
+
+from utils.city_matcher import CityMatcher
+from utils.extract_cache import ExtractCache
+from utils.state_detector import StateDetector
+from utils.location_repository import DB_PATH, write_locations
+from utils.location_binary import BIN_PATH, write_binary, has_table_data
+from utils.spatial_index import fill_missing
+from utils import instrument
+from utils.instrument import span
+
 WIND_PDF = os.path.join(BASE_DIR, "Wind Table.pdf")
 SEISMIC_PDF = os.path.join(BASE_DIR, "Seismic Table.pdf")
 TEMP_PDF = os.path.join(BASE_DIR, "Temperature Table.pdf")
 OUTPUT_JSON = os.path.join(BASE_DIR, "data", "india_data.json")
+OUTPUT_DB = DB_PATH
+OUTPUT_BIN = BIN_PATH
+COORDINATES_JSON = os.path.join(BASE_DIR, "data", "coordinates.json")
+CACHE_DIR = os.path.join(BASE_DIR, "data", ".extract_cache")
+
+# Pages per extraction chunk in --jobs mode; with jobs * 2 chunks in flight
+# per file, memory doesn't depend on the length of the PDF
+CHUNK_PAGES = 4
+
+# Bump whenever a parse_* function changes so stale cache entries are ignored
+PARSER_VERSION = "3"
+
+# Precompiled row matchers, shared by every line of every page
+WHITESPACE = re.compile(r'\s+')
+LEADING_INDEX = re.compile(r'^\d+\W+')
+TEMP_ROW = re.compile(r'([A-Za-z\s\&\(\)\.\-]+)\s+([\-]?\d{1,2}\.?\d*)\s+([\-]?\d{1,2}\.?\d*)')
+WIND_ROW = re.compile(r'([A-Za-z\s\.\(\)]+)\s+(\d{2}(\.\d+)?)')
+SEISMIC_ROW = re.compile(r'([A-Za-z\s\.\(\)]+)\s+(II|III|IV|V)', re.IGNORECASE)
+
+# Shared state/UT header matcher for the Temp table
+STATE_DETECTOR = StateDetector()
 
 def clean_text(text):
     text = text.replace('\xa0', ' ').replace('\u2013', '-').strip()
-    return re.sub(r'\s+', ' ', text)
+    return WHITESPACE.sub(' ', text)
 
-def get_pdf_text(path):
-    if not os.path.exists(path):
-        print(f"Missing: {path}")
-        return []
+def iter_page_lines(page):
+    text = page.get_text("text") # simple text
+    for l in text.split('\n'):
+        if l.strip():
+            yield clean_text(l)
+
+def iter_page_rows(page, y_tolerance=3.0, column_gap=12.0):
+    """
+    Rebuilds table rows from PyMuPDF word boxes instead of guessing from text lines.
+    Words are put in reading order with a single sort, grouped into a row while their
+    vertical centre stays within `y_tolerance` of the row's first word, and split into
+    cells wherever the horizontal gap exceeds `column_gap`. Yields a list of cell strings per row.
+    """
+    # (x0, y0, x1, y1, word, block_no, line_no, word_no)
+    words = page.get_text("words")
+    words.sort(key=lambda w: ((w[1] + w[3]) / 2, w[0]))
+
+    row = []
+    row_y = 0.0
+    for w in words:
+        y = (w[1] + w[3]) / 2
+        if row and y - row_y > y_tolerance:
+            yield row_cells(row, column_gap)
+            row = []
+        if not row:
+            row_y = y
+        row.append(w)
+    if row:
+        yield row_cells(row, column_gap)
+
+def row_cells(words, column_gap):
+    words.sort(key=lambda w: w[0])
+    cells = [[words[0][4]]]
+    for prev, w in zip(words, words[1:]):
+        if w[0] - prev[2] > column_gap:
+            cells.append([])
+        cells[-1].append(w[4])
+    return [clean_text(" ".join(cell)) for cell in cells]
+
+def iter_page_words_lines(page):
+    # Flattens geometric rows back into lines for the row matchers. A state name
+    # in the first column is a merged group cell, so it becomes its own header line
+    for cells in iter_page_rows(page):
+        if len(cells) > 1 and detect_state(cells[0]):
+            yield cells[0]
+            cells = cells[1:]
+        yield " ".join(cells)
+
+def page_line_reader(mode):
+    return iter_page_words_lines if mode == "words" else iter_page_lines
+
+def extract_page_range(path, start, stop, mode="text"):
+    # Worker for the process pool: fitz documents can't be pickled,
+    # so every chunk opens its own handle
+    read_page = page_line_reader(mode)
     doc = fitz.open(path)
     lines = []
-    for page in doc:
-        text = page.get_text("text") # simple text
-        lines.extend([clean_text(l) for l in text.split('\n') if l.strip()])
+    for pno in range(start, stop):
+        lines.extend(read_page(doc[pno]))
+    doc.close()
     return lines
 
-def parse_temp_hierarchy():
-    # Attempt to build State -> City map from Temp PDF
-    # Assumption based on "State-wise" title:
-    # Lines might look like: "StateName" ... "CityName" ... data
-    # OR Table stricture.
-    # We will look for list of standard Indian states to assist parsing if headers aren't clear.
-    
-    lines = get_pdf_text(TEMP_PDF)
-    print(f"Temp PDF Lines: {len(lines)}")
-    
-    data = {}
-    current_state = "Unknown State"
-    
-    # Heuristic: States are usually purely alphabetic strings, often detached provided in sorted order
-    # But text extraction might mix columns.
-    # Let's try a regex for the data row first: "City Max Min"
-    
-    # Common States List for detection
-    STATES = [
-        "Andhra Pradesh", "Arunachal Pradesh", "Assam", "Bihar", "Chhattisgarh", 
-        "Goa", "Gujarat", "Haryana", "Himachal Pradesh", "Jharkhand", "Karnataka", 
-        "Kerala", "Madhya Pradesh", "Maharashtra", "Manipur", "Meghalaya", "Mizoram", 
-        "Nagaland", "Odisha", "Punjab", "Rajasthan", "Sikkim", "Tamil Nadu", 
-        "Telangana", "Tripura", "Uttar Pradesh", "Uttarakhand", "West Bengal",
-        "Andaman & Nicobar", "Chandigarh", "Dadra & Nagar Haveli", "Daman & Diu", 
-        "Delhi", "Lakshadweep", "Puducherry"
-    ]
-    
+def page_chunks(path, size=None):
+    # Split a PDF into contiguous ranges of `size` pages
+    size = size or CHUNK_PAGES
+    doc = fitz.open(path)
+    count = doc.page_count
+    doc.close()
+    return [(path, start, min(start + size, count)) for start in range(0, count, size)]
+
+def submit_extraction(pool, path, jobs, mode="text"):
+    """
+    Queues the first page chunks of `path` on `pool` and returns a generator over
+    the file's lines in page order. Each chunk is yielded as soon as it (and the
+    ones before it) finish, so parsing overlaps with the remaining page decoding.
+    At most jobs * 2 chunks of CHUNK_PAGES pages are in flight or waiting to be
+    read, whatever the file's length; the next one is queued as each is taken,
+    and a chunk's lines are dropped once yielded.
+    """
+    if not os.path.exists(path):
+        print(f"Missing: {path}")
+        return iter(())
+    # Small fixed-size chunks keep results flowing in page order
+    tasks = deque(page_chunks(path))
+    futures = deque()
+
+    def top_up():
+        while tasks and len(futures) < jobs * 2:
+            futures.append(pool.submit(extract_page_range, *tasks.popleft(), mode))
+
+    def stream():
+        while futures:
+            lines = futures.popleft().result()
+            top_up()
+            yield from lines
+            del lines
+
+    top_up()
+    return stream()
+
+def extract_parallel(paths, jobs, mode="text"):
+    """
+    Extracts several PDFs at once, spreading page chunks of every file over one process pool.
+    Returns {path: lines} with each file's lines merged back in page order. The
+    lists hold every line; main() parses the streams instead, chunk by chunk.
+    """
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        streams = {path: submit_extraction(pool, path, jobs, mode) for path in paths}
+        return {path: list(stream) for path, stream in streams.items()}
+
+def iter_pdf_lines(path, mode="text"):
+    # Streams cleaned lines page by page; only one page's text is held at a time.
+    # mode "text" splits page.get_text("text"), "words" rebuilds rows from word boxes
+    if not os.path.exists(path):
+        print(f"Missing: {path}")
+        return
+    read_page = page_line_reader(mode)
+    doc = fitz.open(path)
+    try:
+        for page in doc:
+            yield from read_page(page)
+    finally:
+        doc.close()
+
+def get_pdf_text(path, jobs=1, mode="text"):
+    if jobs > 1:
+        return extract_parallel([path], jobs, mode)[path]
+    return list(iter_pdf_lines(path, mode))
+
+class LineCounter:
+    # Counts lines as they stream through, for the per-table summary
+    def __init__(self, lines):
+        self.lines = lines
+        self.count = 0
+
+    def __iter__(self):
+        for line in self.lines:
+            self.count += 1
+            yield line
+
+def detect_state(line):
+    # Check if line is a State header (name exactly or closely, and short)
+    return STATE_DETECTOR.detect(line)
+
+def iter_temp_records(lines):
+    """
+    Yields (state, city, max_t, min_t) rows from Temp table lines.
+    A state header yields (state, None, None, None); rows seen before any
+    header carry state None.
+    """
+    current_state = None
     for line in lines:
-        # Check if line matches a State Name exactly or closely
         clean = line.strip()
-        is_state = False
-        for s in STATES:
-            if s.lower() == clean.lower() or s.lower() in clean.lower(): 
-                # Be careful not to match "West Bengal" in "West Bengal City" row
-                # If the line is SHORT and matches state, likely a header
-                if len(clean) < len(s) + 5:
-                    current_state = s
-                    if current_state not in data:
-                        data[current_state] = {}
-                    is_state = True
-                    break
-        if is_state: continue
+        state = detect_state(clean)
+        if state:
+            current_state = state
+            yield state, None, None, None
+            continue
 
         # Parse Data Row: City Max Min
         # Regex: Name (Allowing spaces) Float Float
@@ -75,11 +215,11 @@ def parse_temp_hierarchy():
         # Let's assume lines are preserved or joined.
         
         # Look for pattern ending in two numbers
-        match = re.search(r'([A-Za-z\s\&\(\)\.\-]+)\s+([\-]?\d{1,2}\.?\d*)\s+([\-]?\d{1,2}\.?\d*)', clean)
+        match = TEMP_ROW.search(clean)
         if match:
              city = match.group(1).strip()
              # Cleanup city (remove leading numbers/bullets)
-             city = re.sub(r'^\d+\W+', '', city)
+             city = LEADING_INDEX.sub('', city)
              
              max_t = float(match.group(2))
              min_t = float(match.group(3))
@@ -88,48 +228,89 @@ def parse_temp_hierarchy():
              if max_t > 60 or max_t < -10: continue 
              
              if len(city) > 2:
-                 if current_state == "Unknown State":
-                     # Create a default bin if header missed
-                     if "General" not in data: data["General"] = {}
-                     data["General"][city] = {"max": max_t, "min": min_t}
-                 else:
-                     data[current_state][city] = {"max": max_t, "min": min_t}
-                     
-    return data
+                 yield current_state, city, max_t, min_t
 
-def parse_wind_flat():
-    lines = get_pdf_text(WIND_PDF)
-    print(f"Wind PDF Lines: {len(lines)}")
-    db = {}
+def iter_wind_records(lines):
     for line in lines:
         # Patern: City Speed
-        match = re.search(r'([A-Za-z\s\.\(\)]+)\s+(\d{2}(\.\d+)?)', line)
+        match = WIND_ROW.search(line)
         if match:
             city = match.group(1).strip().upper()
             speed = float(match.group(2))
             if 30 <= speed <= 60 and len(city) > 2:
-                db[city] = speed
-    return db
+                yield city, speed
 
-def parse_seismic_flat():
-    lines = get_pdf_text(SEISMIC_PDF)
-    print(f"Seismic PDF Lines: {len(lines)}")
-    db = {}
+def iter_seismic_records(lines):
     for line in lines:
         # Pattern: City Zone (II, III, IV, V)
-        match = re.search(r'([A-Za-z\s\.\(\)]+)\s+(II|III|IV|V)', line, re.IGNORECASE)
+        match = SEISMIC_ROW.search(line)
         if match:
             city = match.group(1).strip().upper()
             zone = match.group(2).upper()
             if len(city) > 2:
-                db[city] = zone
+                yield city, zone
+
+def parse_temp_hierarchy(lines=None, mode="text"):
+    # Attempt to build State -> City map from Temp PDF
+    # Assumption based on "State-wise" title:
+    # Lines might look like: "StateName" ... "CityName" ... data
+    # OR Table stricture.
+    # We will look for list of standard Indian states to assist parsing if headers aren't clear.
+    
+    counter = LineCounter(iter_pdf_lines(TEMP_PDF, mode) if lines is None else lines)
+    
+    data = {}
+    for state, city, max_t, min_t in iter_temp_records(counter):
+        if city is None:
+            data.setdefault(state, {})
+        elif state is None:
+            # Create a default bin if header missed
+            data.setdefault("General", {})[city] = {"max": max_t, "min": min_t}
+        else:
+            data[state][city] = {"max": max_t, "min": min_t}
+                     
+    print(f"Temp PDF Lines: {counter.count}")
+    return data
+
+def parse_wind_flat(lines=None, mode="text"):
+    counter = LineCounter(iter_pdf_lines(WIND_PDF, mode) if lines is None else lines)
+    db = dict(iter_wind_records(counter))
+    print(f"Wind PDF Lines: {counter.count}")
     return db
 
-def update_db_fuzzy(master, flat_data, data_key):
+def parse_seismic_flat(lines=None, mode="text"):
+    counter = LineCounter(iter_pdf_lines(SEISMIC_PDF, mode) if lines is None else lines)
+    db = dict(iter_seismic_records(counter))
+    print(f"Seismic PDF Lines: {counter.count}")
+    return db
+
+def attach_coordinates(master, coordinates):
+    """
+    Adds "lat"/"lon" to every city of `master` found in a
+    {state: {district: [lat, lon]}} gazetteer, exact name first, then a
+    fuzzy match within the same state. Returns the number of cities located.
+    """
+    located = 0
+    for state, cities in master.items():
+        known = coordinates.get(state, {})
+        matcher = CityMatcher(known) if known else None
+        for city, record in cities.items():
+            name = city if city in known else None
+            if name is None and matcher is not None:
+                found = matcher.best_match(city, threshold=90)
+                name = found[0] if found else None
+            if name is not None:
+                record["lat"], record["lon"] = known[name]
+                located += 1
+    return located
+
+def update_db_fuzzy(master, flat_data, data_key, matcher=None):
     # Iterate through all cities in master and try to find match in flat_data
     # flat_data keys are UPPERCASE
     
-    city_list = list(flat_data.keys())
+    # Index the flat table once instead of scanning every key per city
+    if matcher is None:
+        matcher = CityMatcher(flat_data.keys())
     
     for state in master:
         for city in master[state]:
@@ -143,9 +324,9 @@ def update_db_fuzzy(master, flat_data, data_key):
             # 2. Fuzzy Match
             # Only if length is decent to avoid noise
             if len(query) > 3:
-                match, score = process.extractOne(query, city_list)
-                if score >= 90: # High confidence
-                     master[state][city][data_key] = flat_data[match]
+                found = matcher.best_match(query, threshold=90) # High confidence
+                if found:
+                     master[state][city][data_key] = flat_data[found[0]]
                 else:
                     master[state][city][data_key] = "N/A"
             else:
@@ -156,30 +337,157 @@ def update_db_fuzzy(master, flat_data, data_key):
     # For now, we prioritize the hierarchy from Temp as requested (State-wise)
     return master
 
-def main():
-    print("Building State Hierarchy from Temp Table...")
-    full_db = parse_temp_hierarchy()
-    
-    print("Extracting Wind Data...")
-    wind = parse_wind_flat()
-    
-    print("Extracting Seismic Data...")
-    seis = parse_seismic_flat()
+# (cache stage, source PDF, parser, progress message)
+STAGES = [
+    ("temp", TEMP_PDF, parse_temp_hierarchy, "Building State Hierarchy from Temp Table..."),
+    ("wind", WIND_PDF, parse_wind_flat, "Extracting Wind Data..."),
+    ("seismic", SEISMIC_PDF, parse_seismic_flat, "Extracting Seismic Data..."),
+]
+MODES = ["text", "words"]
+
+def count_records(stage, result):
+    if stage == "temp":
+        return sum(len(v) for v in result.values())
+    return len(result)
+
+def compare_modes():
+    # Parses every table with each extraction mode and reports the records recovered
+    counts = {}
+    for name, _, parse, _ in STAGES:
+        for mode in MODES:
+            counts[name, mode] = count_records(name, parse(mode=mode))
+
+    print(f"{'Table':<10}" + "".join(f"{mode:>8}" for mode in MODES))
+    for name, _, _, _ in STAGES:
+        print(f"{name:<10}" + "".join(f"{counts[name, mode]:>8}" for mode in MODES))
+    return counts
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild india_data.json from the IS/IRC table PDFs.")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes for PDF extraction (default: 1, 0 = all cores)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-parse every PDF and ignore the extraction cache")
+    parser.add_argument("--cache-dir", default=CACHE_DIR,
+                        help="Directory of parsed-table cache entries keyed by PDF content hash")
+    parser.add_argument("--mode", choices=MODES, default="text",
+                        help="Row extraction: 'text' splits page text lines, 'words' rebuilds rows from word boxes")
+    parser.add_argument("--compare-modes", action="store_true",
+                        help="Only report record counts per table for every extraction mode")
+    parser.add_argument("--coordinates", default=COORDINATES_JSON,
+                        help="District coordinates as {state: {district: [lat, lon]}} (default: data/coordinates.json)")
+    parser.add_argument("--neighbours", type=int, default=4,
+                        help="Stations used to estimate a value missing from the tables (default: 4)")
+    parser.add_argument("--no-estimate", action="store_true",
+                        help="Leave values missing from the tables as N/A")
+    parser.add_argument("--db", default=OUTPUT_DB,
+                        help="SQLite database whose locations table is updated (default: data/osdag.db)")
+    parser.add_argument("--no-db", action="store_true",
+                        help="Don't update the SQLite database")
+    parser.add_argument("--bin", default=OUTPUT_BIN,
+                        help="Memory-mapped binary copy loaded by the app (default: data/india_data.bin)")
+    parser.add_argument("--no-bin", action="store_true",
+                        help="Don't write the binary copy")
+    parser.add_argument("--force", action="store_true",
+                        help="Write the JSON and database even if no wind or seismic values were parsed")
+    parser.add_argument("--trace", nargs="?", const=instrument.DEFAULT_TRACE_PATH, metavar="FILE",
+                        help="Time every stage and write a Chrome trace (default: osdag_trace.json)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.trace:
+        instrument.enable(args.trace)
+    if args.compare_modes:
+        compare_modes()
+        return
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    cache = None if args.no_cache else ExtractCache(args.cache_dir, variant=f"{PARSER_VERSION}:{args.mode}")
+    stages = STAGES
+
+    # Reuse parsed tables whose PDF hasn't changed, only re-extract the rest
+    results = {}
+    for name, path, _, _ in stages:
+        if cache:
+            with span(f"cache load {name}"):
+                cached = cache.load(name, path)
+            if cached is not None:
+                results[name] = cached
+    pending = [stage for stage in stages if stage[0] not in results]
+
+    pool = None
+    texts = {}
+    if jobs > 1 and pending:
+        # All pending tables share one pool so pages of every PDF run side by side,
+        # each parser consumes its file's lines while later pages are still decoding
+        print(f"Extracting PDFs with {jobs} processes...")
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        texts = {path: submit_extraction(pool, path, jobs, args.mode) for _, path, _, _ in pending}
+
+    try:
+        for name, path, parse, message in pending:
+            print(message)
+            with span(f"parse {name}"):
+                results[name] = parse(texts.get(path), mode=args.mode)
+            if cache:
+                with span(f"cache store {name}"):
+                    cache.store(name, path, results[name])
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+
+    if cache:
+        print(f"Cache: {cache.report()}")
+
+    full_db = results["temp"]
+    wind = results["wind"]
+    seis = results["seismic"]
     
     print("Merging Data...")
-    update_db_fuzzy(full_db, wind, "wind")
-    update_db_fuzzy(full_db, seis, "zone")
+    with span("merge wind"):
+        update_db_fuzzy(full_db, wind, "wind")
+    with span("merge zone"):
+        update_db_fuzzy(full_db, seis, "zone")
+
+    # Locate districts, then estimate unmatched values from the nearest stations
+    if os.path.exists(args.coordinates):
+        with open(args.coordinates, 'r') as f:
+            with span("attach coordinates"):
+                located = attach_coordinates(full_db, json.load(f))
+        print(f"Located {located} cities from {args.coordinates}")
+        if not args.no_estimate:
+            with span("estimate missing values"):
+                filled = fill_missing(full_db, k=args.neighbours)
+            print(f"Estimated {filled} missing values from the {args.neighbours} nearest stations")
     
     # Calculate stats
     total_cities = sum(len(v) for v in full_db.values())
     print(f"DB Built: {len(full_db)} States, {total_cities} Cities.")
+    if not has_table_data(full_db):
+        # An empty rebuild would wipe the JSON and leave the stores out of step
+        if not args.force:
+            print("ERROR: no wind or seismic values were parsed from the PDFs. Nothing was written; "
+                  "check the tables, or pass --force to write the JSON and database anyway.")
+            return 1
+        print(f"WARNING: no wind or seismic values were parsed from the PDFs. {args.bin} is left as is.")
     
     # Ensure directory
     os.makedirs(os.path.dirname(OUTPUT_JSON), exist_ok=True)
     
-    with open(OUTPUT_JSON, 'w') as f:
+    with span("write json"), open(OUTPUT_JSON, 'w') as f:
         json.dump(full_db, f, indent=4)
     print(f"Saved to {OUTPUT_JSON}")
 
+    if not args.no_db:
+        with span("write db"):
+            rows, removed = write_locations(full_db, args.db)
+        print(f"Upserted {rows} locations into {args.db}, removed {removed} no longer in the tables")
+
+    if not args.no_bin and has_table_data(full_db):
+        with span("write bin"):
+            rows = write_binary(full_db, args.bin)
+        print(f"Wrote {rows} locations to {args.bin}")
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
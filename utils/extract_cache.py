@@ -0,0 +1,53 @@
+import os
+import json
+import hashlib
+
+def file_digest(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+class ExtractCache:
+    """
+    On-disk cache of parsed PDF tables, keyed by the PDF's content hash.
+    `variant` is mixed into every key so parser changes invalidate old entries.
+    """
+    def __init__(self, cache_dir, variant=""):
+        self.cache_dir = cache_dir
+        self.variant = variant
+        self.status = {}
+
+    def entry_path(self, stage, path):
+        if not os.path.exists(path):
+            return None
+        key = hashlib.sha256(f"{self.variant}:{file_digest(path)}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{stage}-{key[:24]}.json")
+
+    def load(self, stage, path):
+        entry = self.entry_path(stage, path)
+        if entry and os.path.exists(entry):
+            try:
+                with open(entry, 'r') as f:
+                    data = json.load(f)
+                self.status[stage] = "hit"
+                return data
+            except (OSError, ValueError):
+                pass # Corrupt entry, fall through and rebuild
+        self.status[stage] = "miss"
+        return None
+
+    def store(self, stage, path, data):
+        entry = self.entry_path(stage, path)
+        if entry is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write then rename so an interrupted rebuild never leaves a half entry
+        tmp = entry + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, entry)
+
+    def report(self):
+        return ", ".join(f"{stage}: {state}" for stage, state in self.status.items())
@@ -0,0 +1,61 @@
+import numpy as np
+from utils.geometry_calculator import WIDTH_ALLOWANCE
+from utils.validators import CARRIAGEWAY_MIN, CARRIAGEWAY_MAX
+
+def as_float_arrays(*values):
+    return np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in values))
+
+def calculate_girders_batch(overall_width, spacing, overhang):
+    """
+    Array version of calculate_girders.
+    Formula: No of Girders = (Overall Width - Overhang) / Spacing, rounded half-to-even
+    like Python's round(). Returns 0 where spacing <= 0 or the result isn't finite.
+    """
+    W, S, O = as_float_arrays(overall_width, spacing, overhang)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        val = np.round((W - O) / S)
+    ok = (S > 0) & np.isfinite(val)
+    return np.where(ok, val, 0).astype(np.int64)
+
+def calculate_spacing_batch(overall_width, girders, overhang):
+    """
+    Array version of calculate_spacing.
+    Formula: Spacing = (Overall Width - Overhang) / Girders, 0.0 where girders <= 0.
+    """
+    W, N, O = as_float_arrays(overall_width, girders, overhang)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        val = (W - O) / N
+    return np.where(N > 0, val, 0.0)
+
+def solve_layouts(carriageway_width, overhang, spacing=None, girders=None):
+    """
+    Solves a whole sweep of girder layouts in one call. Inputs are broadcast together.
+
+    Give either `girders` (spacing follows, as in on_girders_changed) or `spacing`
+    (the girder count is rounded from it, clamped to at least 1 and the spacing
+    refitted to that count, as in on_overhang_changed).
+
+    Returns a dict of arrays: overall_width, girders, spacing and valid, where valid
+    requires a carriageway in the software range, a non-negative overhang narrower
+    than the deck, at least one girder and a positive spacing. Given girder
+    counts must be whole numbers: others (2.9, nan) get girders 0 and are invalid.
+    """
+    if (spacing is None) == (girders is None):
+        raise ValueError("Give exactly one of spacing or girders")
+
+    if girders is None:
+        CW, O, S_in = as_float_arrays(carriageway_width, overhang, spacing)
+        W = CW + WIDTH_ALLOWANCE # Rule: Width = CW + 5m
+        N = calculate_girders_batch(W, S_in, O)
+        N = np.where(N <= 0, 1, N) # Avoid div by zero
+    else:
+        CW, O, G = as_float_arrays(carriageway_width, overhang, girders)
+        # A fractional or non-finite count is invalid rather than truncated (2.9 is not 2)
+        integral = np.isfinite(G) & (G == np.floor(G))
+        N = np.where(integral, G, 0).astype(np.int64)
+        W = CW + WIDTH_ALLOWANCE
+    S = calculate_spacing_batch(W, N, O)
+
+    valid = ((CW >= CARRIAGEWAY_MIN) & (CW < CARRIAGEWAY_MAX)
+             & (O >= 0) & (O < W) & (N >= 1) & (S > 0))
+    return {"overall_width": W, "girders": np.asarray(N), "spacing": S, "valid": valid}
@@ -1,3 +1,13 @@
+# Rule: Overall Width = Carriageway + 5m
+WIDTH_ALLOWANCE = 5.0
+
+def overall_width(carriageway_width):
+    """
+    Overall bridge width from carriageway width.
+    Formula: Overall Width = Carriageway + 5m
+    """
+    return carriageway_width + WIDTH_ALLOWANCE
+
 def calculate_girders(overall_width, spacing, overhang):
     """
     Calculates number of girders based on width, spacing and overhang.
@@ -21,3 +31,13 @@ def calculate_spacing(overall_width, girders, overhang):
         return (overall_width - overhang) / girders
     except Exception:
         return 0.0
+
+def rebalance_for_overhang(overall_width, spacing, overhang):
+    """
+    Girders and spacing after an overhang change.
+    1. Closest girder count for the old spacing, 2. exact spacing for that count.
+    Returns (girders, spacing).
+    """
+    girders = calculate_girders(overall_width, spacing, overhang)
+    if girders <= 0: girders = 1 # Avoid div by zero
+    return girders, calculate_spacing(overall_width, girders, overhang)
@@ -0,0 +1,120 @@
+from utils.reactive import Graph
+from utils.geometry_calculator import overall_width, calculate_girders, calculate_spacing, rebalance_for_overhang
+from utils.validators import (validate_span, validate_carriageway, validate_skew,
+                              validate_girders, validate_spacing, validate_overhang)
+from utils.project_options import DEFAULT_GIRDERS, DEFAULT_OVERHANG
+
+# Which of spacing / girder count the user fixed last; the other one follows
+LEAD_SPACING = "spacing"
+LEAD_GIRDERS = "girders"
+
+# Inputs set through the Modify Additional Geometry dialog
+LAYOUT_INPUTS = ("overhang", "lead", "spacing_request", "girders_request")
+
+def parse_float(text):
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return None
+
+def checked(validator):
+    # Validators expect text or numbers; a value that couldn't be derived is invalid
+    return lambda value: (False, "Invalid number.") if value is None else validator(value)
+
+def solve_girders(lead, width, overhang, spacing_request, girders_request):
+    if width is None:
+        return None
+    if lead == LEAD_SPACING:
+        return calculate_girders(width, spacing_request, overhang)
+    return girders_request
+
+def solve_spacing(lead, width, overhang, spacing_request, girders):
+    if width is None:
+        return None
+    if lead == LEAD_SPACING:
+        return spacing_request
+    return calculate_spacing(width, girders, overhang)
+
+class GeometryModel:
+    """
+    Geometric inputs of a project as a reactive Graph, shared by the Basic
+    Inputs tab and the Modify Additional Geometry dialog.
+
+    Inputs: the span / carriageway / skew text, the deck overhang and whichever
+    of spacing or girder count the user fixed last. Derived: overall width,
+    girders, spacing, one (ok, message) check per field and overall validity.
+    """
+    def __init__(self, span="", carriageway="", skew=""):
+        g = self.graph = Graph()
+        g.input("span_text", span)
+        g.input("carriageway_text", carriageway)
+        g.input("skew_text", skew)
+        g.input("overhang", DEFAULT_OVERHANG)
+        g.input("lead", LEAD_GIRDERS)
+        g.input("spacing_request", None)
+        g.input("girders_request", DEFAULT_GIRDERS)
+
+        g.derived("carriageway", parse_float, "carriageway_text")
+        # Span only narrows the suggested layouts when it is valid
+        g.derived("span", lambda text: parse_float(text) if validate_span(text)[0] else None, "span_text")
+        g.derived("overall_width", lambda cw: None if cw is None else overall_width(cw), "carriageway") # Rule: Width = CW + 5m
+        g.derived("girders", solve_girders, "lead", "overall_width", "overhang", "spacing_request", "girders_request")
+        g.derived("spacing", solve_spacing, "lead", "overall_width", "overhang", "spacing_request", "girders")
+
+        g.derived("span_check", validate_span, "span_text")
+        g.derived("carriageway_check", validate_carriageway, "carriageway_text")
+        g.derived("skew_check", validate_skew, "skew_text")
+        g.derived("girders_check", checked(validate_girders), "girders")
+        g.derived("spacing_check", checked(validate_spacing), "spacing")
+        g.derived("overhang_check", checked(validate_overhang), "overhang")
+        g.derived("valid", lambda *checks: all(ok for ok, _ in checks),
+                  "span_check", "carriageway_check", "skew_check",
+                  "girders_check", "spacing_check", "overhang_check")
+
+    def get(self, name):
+        return self.graph.get(name)
+
+    def set(self, name, value):
+        self.graph.set(name, value)
+
+    def update(self, values):
+        self.graph.update(values)
+
+    def observe(self, name, callback):
+        return self.graph.observe(name, callback)
+
+    def unobserve(self, handle):
+        self.graph.unobserve(handle)
+
+    def set_spacing(self, spacing):
+        # Spacing fixed -> girders follow
+        self.update({"spacing_request": spacing, "lead": LEAD_SPACING})
+
+    def set_girders(self, girders):
+        # Girders fixed -> spacing follows
+        self.update({"girders_request": girders, "lead": LEAD_GIRDERS})
+
+    def set_overhang(self, overhang, spacing=None):
+        """
+        New overhang: closest girder count for the current (or given) spacing,
+        then the exact spacing for that count.
+        """
+        width = self.get("overall_width")
+        if width is None:
+            self.set("overhang", overhang)
+            return
+        if spacing is None:
+            spacing = self.get("spacing")
+        girders, _ = rebalance_for_overhang(width, spacing, overhang)
+        self.update({"overhang": overhang, "girders_request": girders, "lead": LEAD_GIRDERS})
+
+    def layout_state(self):
+        # The dialog's inputs, for project files (the tab saves its own fields)
+        return {name: self.get(name) for name in LAYOUT_INPUTS}
+
+    def restore_layout(self, state):
+        self.update({name: state[name] for name in LAYOUT_INPUTS if name in state})
+
+    def apply_layout(self, layout):
+        self.update({"overhang": layout["overhang"], "girders_request": layout["girders"],
+                     "lead": LEAD_GIRDERS})
@@ -0,0 +1,131 @@
+"""
+Opt-in timing of hot call sites.
+
+Off by default. Set OSDAG_TRACE=1 (or OSDAG_TRACE=<file>) or pass --trace
+[FILE] to main.py or utils/extract_all.py to turn it on. Every @traced call and
+`span` block then records its duration. At exit a histogram per name is
+printed and a Chrome trace-event file is written, osdag_trace.json by
+default; open it in chrome://tracing or https://ui.perfetto.dev.
+
+While off, a traced call costs one global lookup and an extra call frame.
+"""
+import os
+import json
+import time
+import atexit
+import functools
+import threading
+
+DEFAULT_TRACE_PATH = "osdag_trace.json"
+# Trace events kept for the file; histograms keep counting past this
+MAX_EVENTS = 1_000_000
+
+enabled = False
+trace_path = None
+origin_ns = time.perf_counter_ns()
+events = []       # (name, start_ns, end_ns, thread id)
+histograms = {}   # name -> [count, total_ns, max_ns, {log2 microsecond bucket: count}]
+thread_names = {}
+lock = threading.Lock()
+
+def enable(path=DEFAULT_TRACE_PATH):
+    global enabled, trace_path
+    if not enabled:
+        atexit.register(dump)
+    enabled = True
+    trace_path = path
+
+def enable_from_env():
+    value = os.environ.get("OSDAG_TRACE", "")
+    if value and value != "0":
+        enable(DEFAULT_TRACE_PATH if value == "1" else value)
+
+def record(name, start, end):
+    thread = threading.current_thread()
+    duration = end - start
+    bucket = (duration // 1000).bit_length()
+    with lock:
+        thread_names.setdefault(thread.ident, thread.name)
+        if len(events) < MAX_EVENTS:
+            events.append((name, start, end, thread.ident))
+        stats = histograms.get(name)
+        if stats is None:
+            stats = histograms[name] = [0, 0, 0, {}]
+        stats[0] += 1
+        stats[1] += duration
+        stats[2] = max(stats[2], duration)
+        stats[3][bucket] = stats[3].get(bucket, 0) + 1
+
+def traced(fn=None, name=None):
+    """Decorator timing every call of fn under `name` (default: its qualified name)."""
+    if fn is None:
+        return lambda f: traced(f, name)
+    label = name or fn.__qualname__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not enabled:
+            return fn(*args, **kwargs)
+        start = time.perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            record(label, start, time.perf_counter_ns())
+    return wrapper
+
+class span:
+    """Times a `with` block under `name`."""
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        if enabled:
+            self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        if self.start is not None:
+            record(self.name, self.start, time.perf_counter_ns())
+
+def bucket_label(bucket):
+    # Bucket b holds durations of [2^(b-1), 2^b) microseconds
+    upper = 1 << bucket
+    return f"<{upper} us" if upper < 1000 else f"<{upper / 1000:.3g} ms"
+
+def report():
+    """Histogram summary of every traced name, slowest total first."""
+    with lock:
+        items = sorted(histograms.items(), key=lambda item: -item[1][1])
+        lines = [f"{'name':<44}{'calls':>8}{'total ms':>11}{'mean ms':>10}{'max ms':>10}"]
+        for name, (count, total, longest, buckets) in items:
+            lines.append(f"{name:<44}{count:>8}{total / 1e6:>11.2f}{total / count / 1e6:>10.3f}{longest / 1e6:>10.3f}")
+            peak = max(buckets.values())
+            for bucket in sorted(buckets):
+                bar = "#" * max(1, round(buckets[bucket] * 30 / peak))
+                lines.append(f"    {bucket_label(bucket):>12} {buckets[bucket]:>8} {bar}")
+    return "\n".join(lines)
+
+def trace_events():
+    pid = os.getpid()
+    with lock:
+        result = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                  for tid, name in thread_names.items()]
+        result += [{"name": name, "cat": "osdag", "ph": "X", "pid": pid, "tid": tid,
+                    "ts": (start - origin_ns) / 1000, "dur": (end - start) / 1000}
+                   for name, start, end, tid in events]
+    return result
+
+def dump(path=None):
+    """Prints the histograms and writes the Chrome trace file."""
+    path = path or trace_path
+    if not histograms:
+        return
+    print(report())
+    with open(path, "w") as f:
+        json.dump({"traceEvents": trace_events(), "displayTimeUnit": "ms"}, f)
+    print(f"Trace written to {os.path.abspath(path)} ({len(events)} events)")
+
+enable_from_env()
@@ -0,0 +1,57 @@
+import math
+from itertools import islice
+from utils.geometry_calculator import overall_width
+from utils.validators import (validate_span, validate_carriageway, GIRDERS_MIN,
+                              SPACING_MIN, SPACING_MAX, OVERHANG_MIN, OVERHANG_MAX)
+
+# Tolerance so spacings landing exactly on a limit count as feasible
+EPS = 1e-9
+
+def overhang_grid(step, preferred):
+    # Every overhang in the software range, closest to the preferred value first
+    count = int(round((OVERHANG_MAX - OVERHANG_MIN) / step))
+    grid = [round(OVERHANG_MIN + i * step, 2) for i in range(count + 1)]
+    return sorted(grid, key=lambda o: (abs(o - preferred), o))
+
+def enumerate_layouts(carriageway_width, span=None, overhang_step=0.05, preferred_overhang=1.0):
+    """
+    Lazily yields every feasible girder layout, best first, as dicts with
+    girders, spacing, overhang and overall_width.
+
+    Ranking: overhang closest to `preferred_overhang` (the dialog's 1.0 m default)
+    first, then fewest girders (fewest members, bearings and connections).
+    Layouts are generated in rank order, so the first few are available at once.
+
+    For each overhang the feasible girder counts are solved directly from
+    SPACING_MIN <= (Overall Width - Overhang) / Girders <= SPACING_MAX,
+    so infeasible combinations are never visited.
+    The limits are the design-basis assumptions in utils/validators.py.
+
+    `span` is only a validity gate: nothing is yielded when the span or the
+    carriageway is outside the software range. The layouts themselves depend
+    on the carriageway width alone, since no span-dependent check (girder
+    depth, deflection) exists yet.
+    """
+    if span is not None and not validate_span(span)[0]:
+        return
+    if not validate_carriageway(carriageway_width)[0]:
+        return
+
+    width = overall_width(float(carriageway_width))
+    for overhang in overhang_grid(overhang_step, preferred_overhang):
+        clear = width - overhang
+        if clear <= 0:
+            continue
+        fewest = max(GIRDERS_MIN, math.ceil(clear / SPACING_MAX - EPS))
+        most = math.floor(clear / SPACING_MIN + EPS)
+        for girders in range(fewest, most + 1):
+            yield {
+                "girders": girders,
+                "spacing": clear / girders,
+                "overhang": overhang,
+                "overall_width": width,
+            }
+
+def top_layouts(carriageway_width, span=None, count=5, **options):
+    """The first `count` layouts of enumerate_layouts, as a list."""
+    return list(islice(enumerate_layouts(carriageway_width, span, **options), count))
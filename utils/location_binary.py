@@ -0,0 +1,233 @@
+"""
+Compact binary form of india_data.json, memory-mapped by the app.
+
+Layout (little-endian):
+    header   magic b"OSLB", version, string/state/record counts
+    strings  (count + 1) uint32 offsets, then the UTF-8 bytes they index
+    states   (name_id, first_record, record_count) per state, sorted by name
+    records  (district_id, state_id, zone_id, wind, max, min, lat, lon,
+             estimated) sorted by state, then district; missing numbers are
+             NaN, a missing zone is NO_STRING, `estimated` is a bit per
+             ESTIMATED_FIELDS entry
+
+Only the header is read on open. A lookup bisects the state table, then that
+state's records, decoding just the names it compares.
+
+Rebuild from the JSON after editing it by hand:
+    python -m utils.location_binary
+
+Windows can't replace a file another process has mapped, so while the app
+runs a rebuild is parked next to it as india_data.bin.new; the next
+BinaryLocationStore opened (e.g. the next app start) moves it into place.
+"""
+import os
+import sys
+import math
+import mmap
+import struct
+
+from utils.location_repository import stored_value, display_number
+from utils.spatial_index import ESTIMATED_FIELDS
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BIN_PATH = os.path.join(BASE_DIR, "data", "india_data.bin")
+JSON_PATH = os.path.join(BASE_DIR, "data", "india_data.json")
+
+MAGIC = b"OSLB"
+VERSION = 2
+NO_STRING = 0xFFFFFFFF
+
+HEADER = struct.Struct("<4sHHIII")  # magic, version, reserved, strings, states, records
+OFFSET = struct.Struct("<I")
+STATE = struct.Struct("<III")       # name_id, first_record, record_count
+# Numbers are float64 so every value reads back exactly as written
+RECORD = struct.Struct("<IIIdddddB7x") # district_id, state_id, zone_id, wind, max, min, lat, lon, estimated
+NUMBER_KEYS = ("wind", "max", "min", "lat", "lon")
+
+def packed_number(value):
+    value = stored_value(value)
+    return math.nan if value is None else float(value)
+
+def pending_path(path):
+    return path + ".new"
+
+def has_table_data(full_db):
+    # True if any district has a wind speed or seismic zone
+    return any(stored_value(info.get(key)) is not None
+               for districts in full_db.values() for info in districts.values()
+               for key in ("wind", "zone"))
+
+def write_binary(full_db, path=BIN_PATH):
+    """
+    Writes a {state: {district: {"wind", "zone", "max", "min"}}} dict in the
+    binary layout. Returns the number of records written.
+
+    Raises ValueError when no district has wind or seismic data, so a failed
+    PDF parse can't replace the store the app prefers with an empty one.
+    """
+    if not has_table_data(full_db):
+        raise ValueError("No wind or seismic data to write; keeping the existing binary file")
+    strings, ids = [], {}
+    def string_id(text):
+        if text not in ids:
+            ids[text] = len(strings)
+            strings.append(text)
+        return ids[text]
+
+    states, records = [], []
+    for state in sorted(full_db):
+        state_id = string_id(state)
+        districts = full_db[state]
+        states.append((state_id, len(records), len(districts)))
+        for district in sorted(districts):
+            info = districts[district]
+            zone = stored_value(info.get("zone"))
+            estimated = info.get("estimated", ())
+            records.append((string_id(district), state_id,
+                            NO_STRING if zone is None else string_id(str(zone)))
+                           + tuple(packed_number(info.get(key)) for key in NUMBER_KEYS)
+                           + (sum(1 << bit for bit, field in enumerate(ESTIMATED_FIELDS) if field in estimated),))
+
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets, pos = [], 0
+    for blob in encoded:
+        offsets.append(pos)
+        pos += len(blob)
+    offsets.append(pos)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    # Write then rename so nobody maps a half-written file. On POSIX a running
+    # app keeps its old mapping; on Windows the rename fails while it's mapped
+    tmp = path + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(strings), len(states), len(records)))
+        f.write(b"".join(OFFSET.pack(o) for o in offsets))
+        f.write(b"".join(encoded))
+        f.write(b"".join(STATE.pack(*s) for s in states))
+        f.write(b"".join(RECORD.pack(*r) for r in records))
+    try:
+        os.replace(tmp, path)
+    except PermissionError:
+        os.replace(tmp, pending_path(path))
+        print(f"{path} is in use; wrote {pending_path(path)}, used from the next start")
+    return len(records)
+
+def promote_pending(path):
+    """
+    Moves a parked rebuild (see write_binary) over `path` if nothing maps
+    `path` any more. Returns the file to open: `path`, or the parked file
+    while another process still holds `path`.
+    """
+    pending = pending_path(path)
+    if os.path.exists(pending):
+        try:
+            os.replace(pending, path)
+        except PermissionError:
+            return pending
+    return path
+
+class BinaryLocationStore:
+    """
+    Read-only location store over a memory-mapped india_data.bin, with the
+    same queries as LocationRepository. Pages are only touched when read, so
+    opening costs a header parse and the dataset stays in the OS page cache.
+    """
+    def __init__(self, path=BIN_PATH):
+        path = promote_pending(path)
+        self.path = path
+        self.source_path = path # Watched by LocationLookupCache for changes
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, self.string_count, self.state_count, self.record_count = \
+            HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            self.data.close()
+            raise ValueError(f"{path} is not a version {VERSION} location file")
+
+        self.offsets_at = HEADER.size
+        self.blob_at = self.offsets_at + OFFSET.size * (self.string_count + 1)
+        blob_size = OFFSET.unpack_from(self.data, self.blob_at - OFFSET.size)[0]
+        self.states_at = self.blob_at + blob_size
+        self.records_at = self.states_at + STATE.size * self.state_count
+
+    def string(self, string_id):
+        start, end = struct.unpack_from("<II", self.data, self.offsets_at + OFFSET.size * string_id)
+        return self.data[self.blob_at + start:self.blob_at + end].decode("utf-8")
+
+    def state_entry(self, i):
+        return STATE.unpack_from(self.data, self.states_at + STATE.size * i)
+
+    def record(self, i):
+        return RECORD.unpack_from(self.data, self.records_at + RECORD.size * i)
+
+    def find_state(self, state):
+        lo, hi = 0, self.state_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.string(self.state_entry(mid)[0]) < state:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.state_count and self.string(self.state_entry(lo)[0]) == state:
+            return self.state_entry(lo)
+        return None
+
+    def states(self):
+        return [self.string(self.state_entry(i)[0]) for i in range(self.state_count)]
+
+    def districts(self, state):
+        entry = self.find_state(state)
+        if entry is None:
+            return []
+        _, first, count = entry
+        return [self.string(self.record(i)[0]) for i in range(first, first + count)]
+
+    def all_locations(self):
+        return [(self.string(r[1]), self.string(r[0]))
+                for r in map(self.record, range(self.record_count))]
+
+    def states_for_district(self, district):
+        # Linear scan of district ids; the table is a few hundred records
+        return sorted(self.string(r[1]) for r in map(self.record, range(self.record_count))
+                      if self.string(r[0]) == district)
+
+    def get(self, state, district):
+        """Returns {"wind", "zone", "max", "min", "lat", "lon"} (missing values left out), or None."""
+        entry = self.find_state(state)
+        if entry is None:
+            return None
+        _, first, count = entry
+        lo, hi = first, first + count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.string(self.record(mid)[0]) < district:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == first + count:
+            return None
+        district_id, _, zone_id, *numbers, estimated = self.record(lo)
+        if self.string(district_id) != district:
+            return None
+
+        record = {key: display_number(value) for key, value in zip(NUMBER_KEYS, numbers)
+                  if not math.isnan(value)}
+        if zone_id != NO_STRING:
+            record["zone"] = self.string(zone_id)
+        if estimated:
+            record["estimated"] = [field for bit, field in enumerate(ESTIMATED_FIELDS) if estimated >> bit & 1]
+        return record
+
+    def close(self):
+        if not self.data.closed:
+            self.data.close()
+
+if __name__ == "__main__":
+    import json
+    source = sys.argv[1] if len(sys.argv) > 1 else JSON_PATH
+    target = sys.argv[2] if len(sys.argv) > 2 else BIN_PATH
+    with open(source, 'r') as f:
+        full_db = json.load(f)
+    rows = write_binary(full_db, target)
+    print(f"Wrote {rows} locations to {target} ({os.path.getsize(target)} bytes, JSON {os.path.getsize(source)} bytes)")
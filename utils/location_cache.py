@@ -0,0 +1,102 @@
+import os
+import threading
+from collections import OrderedDict, namedtuple
+from utils.project_options import ZONE_FACTORS
+from utils.instrument import traced
+
+# Precomputed district record, ready for display
+# `estimated` lists the fields filled in from neighbouring stations
+LocationInfo = namedtuple("LocationInfo", "state district wind zone zone_factor max_temp min_temp estimated text")
+
+def format_location_info(wind, zone, zone_factor, max_t, min_t, estimated=()):
+    # Info panel text of the Basic Inputs tab
+    def mark(field):
+        return " (estimated)" if field in estimated else ""
+    return (f"Basic Wind Speed: {wind} m/s{mark('wind')}\n"
+            f"Seismic Zone: {zone} (Z = {zone_factor}){mark('zone')}\n"
+            f"Max Shade Temp: {max_t} °C{mark('max')}\n"
+            f"Min Shade Temp: {min_t} °C{mark('min')}")
+
+def build_location_info(state, district, record):
+    wind = record.get('wind', 'N/A')
+    zone = record.get('zone', 'N/A')
+    # Factor map for extra credit correctness (IS 1893)
+    zone_factor = ZONE_FACTORS.get(zone, "N/A")
+    max_t = record.get('max', 'N/A')
+    min_t = record.get('min', 'N/A')
+    estimated = tuple(record.get('estimated', ()))
+    text = format_location_info(wind, zone, zone_factor, max_t, min_t, estimated)
+    return LocationInfo(state, district, wind, zone, zone_factor, max_t, min_t, estimated, text)
+
+class LocationLookupCache:
+    """
+    Bounded LRU cache of LocationInfo records keyed by (state, district), in front
+    of any store with get(state, district). Unknown locations are cached as None too.
+    The whole cache is dropped when the store's source file changes (mtime/size).
+    With an `estimator` (a StationIndex), values missing from a record are
+    estimated from the nearest stations before it is cached.
+    """
+    def __init__(self, store, maxsize=256, estimator=None):
+        self.store = store
+        self.maxsize = maxsize
+        self.estimator = estimator
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.signature = self.source_signature()
+
+    def source_signature(self):
+        path = getattr(self.store, "source_path", None)
+        try:
+            st = os.stat(path)
+        except (OSError, TypeError):
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def check_source(self):
+        signature = self.source_signature()
+        if signature != self.signature:
+            with self.lock:
+                self.entries.clear()
+                self.signature = signature
+                self.invalidations += 1
+
+    @traced
+    def get(self, state, district):
+        """Returns the LocationInfo for (state, district), or None if unknown."""
+        self.check_source()
+        key = (state, district)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+
+        record = self.store.get(state, district)
+        if record is not None and self.estimator is not None:
+            record = self.estimator.fill(record)
+        info = build_location_info(state, district, record) if record is not None else None
+
+        with self.lock:
+            self.entries[key] = info
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return info
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
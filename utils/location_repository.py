@@ -0,0 +1,164 @@
+import os
+import sqlite3
+import threading
+from urllib.request import pathname2url
+
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "osdag.db")
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS locations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        state TEXT NOT NULL,
+        district TEXT NOT NULL,
+        wind_speed REAL,
+        seismic_zone TEXT,
+        max_temp REAL,
+        min_temp REAL,
+        lat REAL,
+        lon REAL,
+        estimated TEXT,
+        UNIQUE(state, district)
+    )
+"""
+
+# Columns added after the first schema, created on older databases by write_locations
+ADDED_COLUMNS = {"lat": "REAL", "lon": "REAL", "estimated": "TEXT"}
+
+# UNIQUE(state, district) already serves the state list, districts-per-state and
+# record lookups; district-first lookups (search by town name) need their own index
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_locations_district ON locations(district, state)",
+]
+
+UPSERT = """
+    INSERT INTO locations (state, district, wind_speed, seismic_zone, max_temp, min_temp, lat, lon, estimated)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(state, district) DO UPDATE SET
+        wind_speed = excluded.wind_speed,
+        seismic_zone = excluded.seismic_zone,
+        max_temp = excluded.max_temp,
+        min_temp = excluded.min_temp,
+        lat = excluded.lat,
+        lon = excluded.lon,
+        estimated = excluded.estimated
+"""
+
+# Record keys in the india_data.json shape, in column order
+RECORD_COLUMNS = [("wind", "wind_speed"), ("zone", "seismic_zone"), ("max", "max_temp"),
+                  ("min", "min_temp"), ("lat", "lat"), ("lon", "lon")]
+
+def stored_value(value):
+    # "N/A" placeholders from the fuzzy merge are stored as NULL
+    return None if value in (None, "N/A") else value
+
+def display_number(value):
+    # REAL columns come back as 50.0; show whole numbers the way the JSON did (50)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+class LocationRepository:
+    """
+    Read-only queries over the `locations` table of data/osdag.db.
+    Every lookup is answered by the UNIQUE(state, district) index, so callers
+    fetch only what a combo box needs instead of holding the whole dataset.
+    A missing database behaves as an empty table.
+    """
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = db_path
+        self.source_path = db_path # Watched by LocationLookupCache for changes
+        self.lock = threading.Lock()
+        self.conn = None
+        if os.path.exists(db_path):
+            # Read-only URI; shared across threads behind self.lock
+            uri = f"file:{pathname2url(os.path.abspath(db_path))}?mode=ro"
+            self.conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        # Databases written before coordinates were added lack some columns
+        present = {row[1] for row in self.query("PRAGMA table_info(locations)")}
+        self.record_columns = [(key, column) for key, column in RECORD_COLUMNS if column in present]
+        self.has_estimated = "estimated" in present
+
+    def query(self, sql, params=()):
+        if self.conn is None:
+            return []
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def states(self):
+        return [row[0] for row in self.query(
+            "SELECT DISTINCT state FROM locations ORDER BY state")]
+
+    def districts(self, state):
+        return [row[0] for row in self.query(
+            "SELECT district FROM locations WHERE state = ? ORDER BY district", (state,))]
+
+    def all_locations(self):
+        # Every (state, district) pair, for building search indexes
+        return self.query("SELECT state, district FROM locations ORDER BY state, district")
+
+    def states_for_district(self, district):
+        # District-first lookup, served by idx_locations_district
+        return [row[0] for row in self.query(
+            "SELECT state FROM locations WHERE district = ? ORDER BY state", (district,))]
+
+    def get(self, state, district):
+        """
+        Returns the district record as {"wind", "zone", "max", "min", "lat", "lon"}
+        (the india_data.json shape, NULL columns left out) plus "estimated", the
+        list of estimated fields if any, or None if not found.
+        """
+        columns = [column for _, column in self.record_columns]
+        if self.has_estimated:
+            columns.append("estimated")
+        rows = self.query(
+            f"SELECT {', '.join(columns)} FROM locations "
+            "WHERE state = ? AND district = ?", (state, district))
+        if not rows:
+            return None
+        values = list(rows[0])
+        estimated = values.pop() if self.has_estimated else None
+        record = {key: display_number(value) for (key, _), value in zip(self.record_columns, values)
+                  if value is not None}
+        if estimated:
+            record["estimated"] = estimated.split(",")
+        return record
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+def write_locations(full_db, db_path=DB_PATH):
+    """
+    Bulk-loads a {state: {district: {"wind", "zone", "max", "min", ...}}} dict into the
+    locations table in a single transaction, upserting on (state, district) and
+    deleting the locations `full_db` no longer has. An empty `full_db` deletes
+    nothing. Returns (rows written, rows deleted).
+    """
+    rows = [
+        (state, district) + tuple(stored_value(info.get(key)) for key, _ in RECORD_COLUMNS)
+        + (",".join(info.get("estimated", ())) or None,)
+        for state, districts in full_db.items()
+        for district, info in districts.items()
+    ]
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn: # Commits once on success, rolls everything back on error
+            conn.execute(SCHEMA)
+            present = {row[1] for row in conn.execute("PRAGMA table_info(locations)")}
+            for column, kind in ADDED_COLUMNS.items():
+                if column not in present:
+                    conn.execute(f"ALTER TABLE locations ADD COLUMN {column} {kind}")
+            for index in INDEXES:
+                conn.execute(index)
+            conn.executemany(UPSERT, rows)
+            # Renamed or dropped districts; the JSON and binary copy no longer have them
+            stale = []
+            if rows:
+                stale = [(state, district) for state, district
+                         in conn.execute("SELECT state, district FROM locations")
+                         if district not in full_db.get(state, ())]
+                conn.executemany("DELETE FROM locations WHERE state = ? AND district = ?", stale)
+    finally:
+        conn.close()
+    return len(rows), len(stale)
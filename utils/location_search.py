@@ -0,0 +1,74 @@
+from utils.city_matcher import CityMatcher, normalise
+
+# Match kinds, best first
+DISTRICT_NAME, DISTRICT_WORD, STATE_NAME, STATE_WORD = range(4)
+
+class LocationSearchIndex:
+    """
+    Type-ahead index over every state and district name.
+
+    Each normalised name, and every later word in it ("new delhi" -> "delhi"),
+    is inserted into a character trie. Every trie node keeps its best `depth`
+    entries pre-ranked, so a keystroke costs one walk of the typed prefix:
+    district names before state names, whole-name prefixes before word
+    prefixes, then shorter names. A state match lists that state's districts.
+    Prefixes with no hit fall back to fuzzy matching on district names.
+    """
+    def __init__(self, locations, depth=20):
+        self.entries = [(state, district) for state, district in locations]
+        self.depth = depth
+        self.root = {}
+        for i, (state, district) in enumerate(self.entries):
+            for name, whole, word in ((district, DISTRICT_NAME, DISTRICT_WORD),
+                                      (state, STATE_NAME, STATE_WORD)):
+                key = normalise(name)
+                rank = (len(district), district, state)
+                self.insert(key, (whole,) + rank, i)
+                words = key.split()
+                for n in range(1, len(words)):
+                    self.insert(" ".join(words[n:]), (word,) + rank, i)
+        self.finalise(self.root)
+
+        self.by_name = {}
+        for i, (state, district) in enumerate(self.entries):
+            self.by_name.setdefault(district, []).append(i)
+        self.matcher = CityMatcher(self.by_name)
+
+    def insert(self, key, score, entry):
+        node = self.root
+        for ch in key:
+            node = node.setdefault(ch, {})
+            node.setdefault(None, []).append((score, entry))
+
+    def finalise(self, node):
+        # Keep each node's best `depth` distinct entries, already in rank order
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            ranked, seen = [], set()
+            for score, entry in sorted(node.get(None, ())):
+                if entry not in seen:
+                    seen.add(entry)
+                    ranked.append(entry)
+                    if len(ranked) == self.depth:
+                        break
+            node[None] = ranked
+            stack.extend(child for ch, child in node.items() if ch is not None)
+
+    def search(self, text, limit=10):
+        """Returns up to `limit` (state, district) matches for `text`, best first."""
+        key = normalise(text)
+        if not key:
+            return []
+        node = self.root
+        for ch in key:
+            node = node.get(ch)
+            if node is None:
+                return self.fuzzy(text, limit)
+        return [self.entries[i] for i in node[None][:limit]]
+
+    def fuzzy(self, text, limit):
+        results = []
+        for name, _ in self.matcher.matches(text, limit=limit):
+            results.extend(self.entries[i] for i in self.by_name[name])
+        return results[:limit]
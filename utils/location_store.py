@@ -0,0 +1,52 @@
+import os
+import json
+
+from utils.location_repository import DB_PATH, LocationRepository
+from utils.location_binary import BIN_PATH, JSON_PATH, BinaryLocationStore, pending_path
+
+class JsonLocationStore:
+    """
+    Location store over india_data.json, with the same queries as
+    LocationRepository. Slowest to open; used when only the JSON exists,
+    e.g. while the data is being edited by hand.
+    """
+    def __init__(self, path=JSON_PATH):
+        self.path = path
+        self.source_path = path # Watched by LocationLookupCache for changes
+        with open(path, 'r') as f:
+            self.data = json.load(f)
+
+    def states(self):
+        return sorted(self.data)
+
+    def districts(self, state):
+        return sorted(self.data.get(state, {}))
+
+    def all_locations(self):
+        return [(state, district) for state in self.states() for district in self.districts(state)]
+
+    def states_for_district(self, district):
+        return sorted(state for state, districts in self.data.items() if district in districts)
+
+    def get(self, state, district):
+        record = self.data.get(state, {}).get(district)
+        if record is None:
+            return None
+        return {key: value for key, value in record.items() if value not in (None, "N/A")}
+
+    def close(self):
+        pass
+
+def open_location_store(bin_path=BIN_PATH, db_path=DB_PATH, json_path=JSON_PATH):
+    """
+    Opens the fastest location store available: the memory-mapped binary file,
+    then the SQLite database, then the JSON. All three answer the same queries.
+    """
+    if os.path.exists(bin_path) or os.path.exists(pending_path(bin_path)):
+        try:
+            return BinaryLocationStore(bin_path)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring {bin_path}: {e}")
+    if os.path.exists(db_path) or not os.path.exists(json_path):
+        return LocationRepository(db_path)
+    return JsonLocationStore(json_path)
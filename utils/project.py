@@ -0,0 +1,153 @@
+"""
+Project files: a ProjectDocument of input values, saved in a compact binary
+form with an append-only autosave journal, and exported as JSON.
+
+Layout:
+    header   magic b"OSDP", version
+    frames   (length, crc32) then a MessagePack map (utils/binary_pack.py)
+
+The first frame holds every field, each later frame only the fields an
+autosave found changed; loading applies them in order. A frame cut short by a
+crash fails its CRC and is dropped, with everything after it, on load. Saving
+(and compaction, every COMPACT_EVERY autosaves) rewrites the file as one frame.
+"""
+import os
+import json
+import zlib
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.binary_pack import pack, unpack
+
+MAGIC = b"OSDP"
+VERSION = 1
+HEADER = struct.Struct("<4sH")  # magic, version
+FRAME = struct.Struct("<II")    # payload length, crc32
+PROJECT_EXTENSION = ".osdp"
+
+# Autosaved frames before the journal is folded back into a single snapshot
+COMPACT_EVERY = 50
+
+def frame(fields):
+    payload = pack(fields)
+    return FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+def write_project(path, fields):
+    """Writes `fields` as a single-frame project file, replacing `path` atomically."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION))
+        f.write(frame(fields))
+    os.replace(tmp_path, path)
+
+def append_changes(path, changes):
+    """Appends one journal frame of changed fields."""
+    with open(path, "ab") as f:
+        f.write(frame(changes))
+
+def read_project(path):
+    """Returns (fields, frame count, bytes up to the end of the last intact frame)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is not an OSDAG project file")
+    magic, version = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not an OSDAG project file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported project file version {version}")
+
+    fields, frames = {}, 0
+    pos = HEADER.size
+    while pos + FRAME.size <= len(data):
+        length, crc = FRAME.unpack_from(data, pos)
+        payload = data[pos + FRAME.size:pos + FRAME.size + length]
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            break # Torn autosave; the frames before it are intact
+        fields.update(unpack(payload))
+        frames += 1
+        pos += FRAME.size + length
+    if frames == 0:
+        raise ValueError(f"{path} holds no project data")
+    return fields, frames, pos
+
+def export_json(fields, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"format": "osdag-project", "version": VERSION, "fields": fields}, f, indent=4)
+
+class ProjectDocument:
+    """
+    Input values of one project by field name, plus the fields changed since
+    they were last written. `path` is None until the project is first saved.
+    """
+    def __init__(self, fields=None, path=None, frames=0):
+        self.fields = dict(fields or {})
+        self.path = path
+        self.frames = frames # Frames in the file at `path`
+        self.changed = set()
+
+    @classmethod
+    def load(cls, path):
+        fields, frames, size = read_project(path)
+        if size < os.path.getsize(path):
+            os.truncate(path, size) # Later autosaves must follow the last good frame
+        return cls(fields, path, frames)
+
+    def get(self, name, default=None):
+        return self.fields.get(name, default)
+
+    def update(self, values):
+        """Sets several fields; only the ones that differ are marked changed."""
+        for name, value in values.items():
+            if name not in self.fields or self.fields[name] != value:
+                self.fields[name] = value
+                self.changed.add(name)
+
+    def take_changes(self):
+        changes = {name: self.fields[name] for name in self.changed}
+        self.changed = set()
+        return changes
+
+class Autosaver:
+    """
+    Writes a ProjectDocument on one background thread, so the GUI thread only
+    collects the changed fields. Writes run in submission order; each call
+    returns the Future of its write, or None when there was nothing to write.
+    """
+    def __init__(self, compact_every=COMPACT_EVERY):
+        self.compact_every = compact_every
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosave")
+
+    def submit(self, fn, *args):
+        future = self.executor.submit(fn, *args)
+        future.add_done_callback(report_failure)
+        return future
+
+    def autosave(self, document):
+        """Journals the fields changed since the last write; compacts now and then."""
+        if document.path is None or not document.changed:
+            return None
+        changes = document.take_changes()
+        if document.frames >= self.compact_every:
+            document.frames = 1
+            return self.submit(write_project, document.path, dict(document.fields))
+        document.frames += 1
+        return self.submit(append_changes, document.path, changes)
+
+    def save(self, document, path=None):
+        """Full save (to `path` if given), which also compacts the journal."""
+        if path is not None:
+            document.path = path
+        document.take_changes()
+        document.frames = 1
+        return self.submit(write_project, document.path, dict(document.fields))
+
+    def close(self):
+        # Lets queued writes finish
+        self.executor.shutdown(wait=True)
+
+def report_failure(future):
+    error = future.exception()
+    if error is not None:
+        print(f"Project save failed: {error}")
@@ -0,0 +1,14 @@
+# Choices offered by the Basic Inputs tab, shared with headless tools
+
+STRUCTURE_TYPES = ["Highway", "Other"]
+FOOTPATH_OPTIONS = ["None", "Single-sided", "Both"]
+STEEL_GRADES = ["E250", "E350", "E450"]
+CONCRETE_GRADES = [f"M{i}" for i in range(25, 65, 5)]
+SEISMIC_ZONES = ["II", "III", "IV", "V"]
+
+# Zone factor Z per seismic zone (IS 1893)
+ZONE_FACTORS = {"II": 0.10, "III": 0.16, "IV": 0.24, "V": 0.36}
+
+# Starting layout of the Modify Additional Geometry dialog
+DEFAULT_GIRDERS = 4
+DEFAULT_OVERHANG = 1.0
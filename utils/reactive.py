@@ -0,0 +1,99 @@
+class Node:
+    def __init__(self, name, order, fn=None, deps=(), value=None):
+        self.name = name
+        self.order = order # Creation order; a node only depends on older nodes
+        self.fn = fn
+        self.deps = list(deps)
+        self.dependents = []
+        self.value = value
+        self.dirty = fn is not None
+        self.observers = []
+        self.last_seen = None # Value observers were last told about
+
+class Graph:
+    """
+    Dependency graph of input and derived values.
+
+    Inputs are set(); derived nodes compute fn(*dependency values) lazily on
+    get() and keep the result until an upstream input changes. Setting an input
+    only marks its downstream nodes dirty, so an edit recomputes just the nodes
+    that depend on it, and only when they are read. Observers of a node are
+    called with its new value after each set() that changed it.
+    """
+    def __init__(self):
+        self.nodes = {}
+        self.recomputed = 0 # Derived node evaluations, for profiling
+
+    def input(self, name, value=None):
+        return self.add(Node(name, len(self.nodes), value=value))
+
+    def derived(self, name, fn, *deps):
+        node = self.add(Node(name, len(self.nodes), fn=fn, deps=[self.nodes[d] for d in deps]))
+        for dep in node.deps:
+            dep.dependents.append(node)
+        return node
+
+    def add(self, node):
+        if node.name in self.nodes:
+            raise ValueError(f"Node '{node.name}' already exists")
+        self.nodes[node.name] = node
+        return node
+
+    def get(self, name):
+        return self.evaluate(self.nodes[name])
+
+    def evaluate(self, node):
+        if node.dirty:
+            node.value = node.fn(*(self.evaluate(dep) for dep in node.deps))
+            node.dirty = False
+            self.recomputed += 1
+        return node.value
+
+    def set(self, name, value):
+        self.update({name: value})
+
+    def update(self, values):
+        """Sets several inputs at once; observers run once, after all of them."""
+        touched = {}
+        for name, value in values.items():
+            node = self.nodes[name]
+            if node.fn is not None:
+                raise ValueError(f"'{name}' is derived and can't be set")
+            if node.value == value:
+                continue
+            node.value = value
+            touched[node.name] = node
+            stack = list(node.dependents)
+            while stack:
+                dependent = stack.pop()
+                if dependent.name in touched:
+                    continue
+                dependent.dirty = True
+                touched[dependent.name] = dependent
+                stack.extend(dependent.dependents)
+        self.notify(touched.values())
+
+    def notify(self, nodes):
+        # Oldest first, so observers see upstream changes before downstream ones
+        for node in sorted(nodes, key=lambda n: n.order):
+            if not node.observers:
+                continue
+            previous = node.last_seen
+            value = self.evaluate(node)
+            if value != previous:
+                node.last_seen = value
+                for callback in list(node.observers):
+                    callback(value)
+
+    def observe(self, name, callback):
+        """Calls callback(value) whenever `name` changes. Returns a handle for unobserve()."""
+        node = self.nodes[name]
+        if not node.observers:
+            node.last_seen = self.evaluate(node)
+        node.observers.append(callback)
+        return (node, callback)
+
+    def unobserve(self, handle):
+        node, callback = handle
+        if callback in node.observers:
+            node.observers.remove(callback)
@@ -0,0 +1,111 @@
+import os
+import sys
+import threading
+
+from utils.location_store import open_location_store
+from utils.location_cache import LocationLookupCache
+from utils.location_search import LocationSearchIndex
+from utils.spatial_index import LazyStationIndex
+
+def file_signature(path):
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return st.st_mtime_ns, st.st_size
+
+class SharedLocations:
+    """
+    The one location store of the process, shared by every project window.
+    Records are read from the store on demand (the memory-mapped binary file
+    when there is one); what is shared on top of it is the LazyStationIndex,
+    the LocationLookupCache, the search index and the interned state and
+    district names. When the store's source file changes, the store is
+    reopened and those are rebuilt on next use.
+    """
+    def __init__(self, store, reopen=None):
+        # Opens the store again after its source file changed
+        self.reopen = reopen or (lambda: type(store)(store.source_path))
+        self.lock = threading.Lock()
+        self.estimator = LazyStationIndex(store)
+        self.use(store)
+        self.lookup = LocationLookupCache(self, estimator=self.estimator)
+
+    def use(self, store):
+        self.store = store
+        self.signature = file_signature(store.source_path)
+        self.state_names = None
+        self.district_names = {}
+        self.search_index = None
+        self.estimator.reset(store)
+
+    @property
+    def source_path(self):
+        # Watched by LocationLookupCache, as for the stores themselves
+        return self.store.source_path
+
+    def current_store(self):
+        with self.lock:
+            if file_signature(self.store.source_path) != self.signature:
+                # The old store isn't closed here: a worker may still be reading
+                # it, and it is released with its last reference
+                self.use(self.reopen())
+            return self.store
+
+    def states(self):
+        store = self.current_store()
+        with self.lock:
+            if self.state_names is None:
+                self.state_names = tuple(sys.intern(state) for state in store.states())
+            return list(self.state_names)
+
+    def districts(self, state):
+        store = self.current_store()
+        with self.lock:
+            names = self.district_names.get(state)
+            if names is None:
+                names = tuple(sys.intern(district) for district in store.districts(state))
+                self.district_names[state] = names
+            return list(names)
+
+    def all_locations(self):
+        return self.current_store().all_locations()
+
+    def states_for_district(self, district):
+        return self.current_store().states_for_district(district)
+
+    def get(self, state, district):
+        return self.current_store().get(state, district)
+
+    def search(self, text, limit=10):
+        # The type-ahead index is built on the first search of any window
+        store = self.current_store()
+        with self.lock:
+            if self.search_index is None:
+                self.search_index = LocationSearchIndex(store.all_locations())
+            index = self.search_index
+        return index.search(text, limit)
+
+    def close(self):
+        pass
+
+shared = None
+shared_lock = threading.Lock()
+
+def shared_locations(store=None):
+    """
+    The process-wide SharedLocations, built on first use around `store` or
+    around open_location_store().
+    """
+    global shared
+    with shared_lock:
+        if shared is None:
+            if store is None:
+                shared = SharedLocations(open_location_store(), reopen=open_location_store)
+            else:
+                shared = SharedLocations(store)
+    return shared
+
+def loaded_shared_locations():
+    """The shared locations if already built, else None (never blocks on a load)."""
+    return shared
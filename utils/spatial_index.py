@@ -0,0 +1,182 @@
+import math
+import heapq
+import threading
+from collections import defaultdict
+
+from utils.location_repository import display_number
+
+EARTH_RADIUS_KM = 6371.0
+
+# Fields that can be estimated from neighbouring stations
+ESTIMATED_FIELDS = ("wind", "zone", "max", "min")
+
+def to_xyz(lat, lon):
+    # Unit-sphere point; straight-line (chord) order equals great-circle order
+    lat, lon = math.radians(lat), math.radians(lon)
+    c = math.cos(lat)
+    return (c * math.cos(lon), c * math.sin(lon), math.sin(lat))
+
+def chord_to_km(chord):
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+class KDTree:
+    """
+    Static 3-d tree over (lat, lon) points mapped onto the unit sphere.
+    nearest() returns the k closest points by great-circle distance, visiting
+    only the branches that can still hold a closer point.
+    """
+    def __init__(self, points):
+        self.points = [to_xyz(lat, lon) for lat, lon in points]
+        self.root = self.build(list(range(len(self.points))), 0)
+
+    def build(self, ids, depth):
+        if not ids:
+            return None
+        axis = depth % 3
+        ids.sort(key=lambda i: self.points[i][axis])
+        mid = len(ids) // 2
+        return (ids[mid], axis, self.build(ids[:mid], depth + 1), self.build(ids[mid + 1:], depth + 1))
+
+    def nearest(self, lat, lon, k=1):
+        """Returns up to k (distance_km, point_index) pairs, closest first."""
+        target = to_xyz(lat, lon)
+        heap = [] # (-squared chord, index), the farthest kept neighbour on top
+
+        def visit(node):
+            if node is None:
+                return
+            i, axis, left, right = node
+            p = self.points[i]
+            d2 = (p[0] - target[0]) ** 2 + (p[1] - target[1]) ** 2 + (p[2] - target[2]) ** 2
+            if len(heap) < k:
+                heapq.heappush(heap, (-d2, i))
+            elif d2 < -heap[0][0]:
+                heapq.heapreplace(heap, (-d2, i))
+            diff = target[axis] - p[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            visit(near)
+            if len(heap) < k or diff * diff < -heap[0][0]:
+                visit(far)
+
+        visit(self.root)
+        return sorted((chord_to_km(math.sqrt(-d2)), i) for d2, i in heap)
+
+def has_value(record, field):
+    # Values estimated earlier are never used as a source for new estimates
+    return record.get(field) not in (None, "N/A") and field not in record.get("estimated", ())
+
+class StationIndex:
+    """
+    Fills missing wind/zone/temperature values from the nearest stations that
+    have them: one KDTree per field, inverse-distance weighting (power `power`)
+    over the `k` nearest for numbers, an inverse-distance weighted vote for the
+    seismic zone. `stations` is an iterable of (lat, lon, record).
+    """
+    def __init__(self, stations, k=4, power=2):
+        self.k = k
+        self.power = power
+        self.trees = {}
+        self.values = {}
+        stations = list(stations)
+        for field in ESTIMATED_FIELDS:
+            having = [(lat, lon, record[field]) for lat, lon, record in stations if has_value(record, field)]
+            if having:
+                self.trees[field] = KDTree([(lat, lon) for lat, lon, _ in having])
+                self.values[field] = [value for _, _, value in having]
+
+    def estimate(self, lat, lon, field):
+        """Estimated value of `field` at (lat, lon), or None if no station has it."""
+        tree = self.trees.get(field)
+        if tree is None:
+            return None
+        values = self.values[field]
+        neighbours = tree.nearest(lat, lon, self.k)
+        if neighbours[0][0] < 1e-3:
+            return values[neighbours[0][1]] # A station at the same spot
+        weights = [(1.0 / distance ** self.power, values[i]) for distance, i in neighbours]
+        if field == "zone":
+            votes = defaultdict(float)
+            for weight, zone in weights:
+                votes[zone] += weight
+            return max(votes, key=votes.get)
+        total = sum(weight for weight, _ in weights)
+        return display_number(round(sum(weight * float(value) for weight, value in weights) / total, 1))
+
+    def fill(self, record):
+        """
+        Returns `record` with its missing fields estimated, listed under
+        "estimated". Records without coordinates are returned unchanged.
+        """
+        lat, lon = record.get("lat"), record.get("lon")
+        missing = [field for field in ESTIMATED_FIELDS if record.get(field) in (None, "N/A")]
+        if lat is None or lon is None or not missing:
+            return record
+        filled = dict(record)
+        estimated = list(record.get("estimated", ()))
+        for field in missing:
+            value = self.estimate(lat, lon, field)
+            if value is not None:
+                filled[field] = value
+                estimated.append(field)
+        if estimated:
+            filled["estimated"] = estimated
+        return filled
+
+def needs_estimate(record):
+    return (record.get("lat") is not None and record.get("lon") is not None
+            and any(record.get(field) in (None, "N/A") for field in ESTIMATED_FIELDS))
+
+class LazyStationIndex:
+    """
+    StationIndex over a location store, built on the first record that
+    actually needs an estimate. extract_all already fills the stores, so
+    usually that never happens and no record is read for it.
+    """
+    def __init__(self, store, k=4, power=2):
+        self.store = store
+        self.k = k
+        self.power = power
+        self.index = None
+        self.lock = threading.Lock()
+
+    def fill(self, record):
+        if not needs_estimate(record):
+            return record
+        with self.lock:
+            if self.index is None:
+                self.index = StationIndex(store_stations(self.store), k=self.k, power=self.power)
+            index = self.index
+        return index.fill(record)
+
+    def reset(self, store):
+        # The store was reopened on new data; the next estimate rebuilds the index
+        with self.lock:
+            self.store = store
+            self.index = None
+
+def db_stations(full_db):
+    return [(record["lat"], record["lon"], record)
+            for districts in full_db.values() for record in districts.values()
+            if record.get("lat") is not None and record.get("lon") is not None]
+
+def store_stations(store):
+    # Every located record of a location store (LocationRepository and friends)
+    for state, district in store.all_locations():
+        record = store.get(state, district)
+        if record and record.get("lat") is not None and record.get("lon") is not None:
+            yield record["lat"], record["lon"], record
+
+def fill_missing(full_db, k=4, power=2):
+    """
+    Estimates every missing value of a {state: {district: record}} dict in place
+    from the stations that have data. Returns the number of values filled.
+    """
+    index = StationIndex(db_stations(full_db), k=k, power=power)
+    filled = 0
+    for districts in full_db.values():
+        for district, record in districts.items():
+            estimated = index.fill(record)
+            if estimated is not record:
+                filled += len(estimated.get("estimated", ())) - len(record.get("estimated", ()))
+                districts[district] = estimated
+    return filled
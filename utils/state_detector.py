@@ -0,0 +1,59 @@
+import re
+
+# States and Union Territories, in the spelling used for the database keys
+STATES = [
+    "Andhra Pradesh", "Arunachal Pradesh", "Assam", "Bihar", "Chhattisgarh",
+    "Goa", "Gujarat", "Haryana", "Himachal Pradesh", "Jharkhand", "Karnataka",
+    "Kerala", "Madhya Pradesh", "Maharashtra", "Manipur", "Meghalaya", "Mizoram",
+    "Nagaland", "Odisha", "Punjab", "Rajasthan", "Sikkim", "Tamil Nadu",
+    "Telangana", "Tripura", "Uttar Pradesh", "Uttarakhand", "West Bengal",
+    "Andaman & Nicobar", "Chandigarh", "Dadra & Nagar Haveli", "Daman & Diu",
+    "Delhi", "Lakshadweep", "Puducherry", "Jammu & Kashmir", "Ladakh",
+    "Dadra & Nagar Haveli and Daman & Diu"
+]
+
+# Older or abbreviated names found in IS/IRC tables -> canonical name
+ALIASES = {
+    "J&K": "Jammu & Kashmir",
+    "J & K": "Jammu & Kashmir",
+    "Orissa": "Odisha",
+    "Uttaranchal": "Uttarakhand",
+    "Pondicherry": "Puducherry",
+    "Andaman & Nicobar Islands": "Andaman & Nicobar",
+    "NCT of Delhi": "Delhi",
+}
+
+AND = re.compile(r'\s+and\s+')
+WHITESPACE = re.compile(r'\s+')
+
+def normalise(name):
+    # "Jammu and Kashmir" and "Jammu & Kashmir" compare equal
+    return WHITESPACE.sub(' ', AND.sub(' & ', name.lower())).strip()
+
+class StateDetector:
+    """
+    Detects state/UT header lines with one precompiled alternation over the
+    normalised names (longest first), instead of testing every state per line.
+    A line is a header when it contains a name and is at most `slack` - 1
+    characters longer than it, so "West Bengal City" rows are not headers.
+    """
+    def __init__(self, names=STATES, aliases=ALIASES, slack=5):
+        self.slack = slack
+        self.canonical = {normalise(name): name for name in names}
+        for alias, name in aliases.items():
+            self.canonical[normalise(alias)] = name
+        keys = sorted(self.canonical, key=len, reverse=True)
+        self.pattern = re.compile("|".join(re.escape(key) for key in keys))
+        self.max_len = len(keys[0]) + slack
+
+    def detect(self, line):
+        """Returns the canonical state name if `line` is a state header, else None."""
+        key = normalise(line)
+        if len(key) >= self.max_len:
+            return None # Too long to be a header, skip the search
+        if key in self.canonical:
+            return self.canonical[key]
+        match = self.pattern.search(key)
+        if match and len(key) < len(match.group()) + self.slack:
+            return self.canonical[match.group()]
+        return None
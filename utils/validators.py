@@ -1,8 +1,33 @@
+# Software ranges
+SPAN_MIN, SPAN_MAX = 20, 45
+CARRIAGEWAY_MIN, CARRIAGEWAY_MAX = 4.25, 24
+SKEW_MAX = 15
+
+# Girder layout limits (geometry dialog, layout_enumerator, validators_batch,
+# GeometryModel). Unlike the ranges above they are NOT taken from the IRC/IS
+# tables or the module specification: they are this module's design-basis
+# assumptions for a steel plate girder deck, kept here as the one place a
+# project with a different design basis should change them.
+#   GIRDERS_MIN     fewest girders that carry the deck as a girder system
+#                   (one girder would need a box / torsion design)
+#   SPACING_MIN/MAX usual centre-to-centre spacing of plate girders under a
+#                   cast-in-situ slab; wider spacing needs a thicker deck slab
+#                   than the default design assumes, closer wastes steel
+#   OVERHANG_MIN/MAX deck cantilever past the outer girder; 0 is flush, 2 m
+#                   keeps the cantilever slab in ordinary proportions
+GIRDERS_MIN = 2
+SPACING_MIN, SPACING_MAX = 1.5, 4.0
+OVERHANG_MIN, OVERHANG_MAX = 0.0, 2.0
+
+GIRDERS_MESSAGE = f"At least {GIRDERS_MIN} girders are required."
+SPACING_MESSAGE = f"Girder spacing must be between {SPACING_MIN}m and {SPACING_MAX}m."
+OVERHANG_MESSAGE = f"Deck overhang must be between {OVERHANG_MIN:g}m and {OVERHANG_MAX}m."
+
 def validate_span(value):
     """Rule: 20 <= Span <= 45"""
     try:
         val = float(value)
-        if val < 20 or val > 45:
+        if val < SPAN_MIN or val > SPAN_MAX:
              return False, "Outside the software range."
         return True, ""
     except ValueError:
@@ -12,7 +37,7 @@ def validate_carriageway(value):
     """Rule: 4.25 <= Carriageway < 24"""
     try:
         val = float(value)
-        return 4.25 <= val < 24, "Carriageway width must be ≥ 4.25m and < 24m."
+        return CARRIAGEWAY_MIN <= val < CARRIAGEWAY_MAX, "Carriageway width must be ≥ 4.25m and < 24m."
     except ValueError:
         return False, "Invalid number."
 
@@ -20,8 +45,44 @@ def validate_skew(value):
     """Rule: Abs(Skew) <= 15"""
     try:
         val = float(value)
-        if abs(val) > 15:
+        if abs(val) > SKEW_MAX:
             return True, "IRC 24 (2010) requires detailed analysis" 
         return True, ""
     except ValueError:
         return False, "Invalid number."
+
+def int_value(value):
+    # int(), except that a fractional float is not truncated (2.9 is not 2 girders)
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"{value} is not a whole number")
+    return int(value)
+
+def validate_girders(value):
+    """Rule: Girders >= GIRDERS_MIN (design-basis assumption, see above)"""
+    try:
+        val = int_value(value)
+        if val < GIRDERS_MIN:
+            return False, GIRDERS_MESSAGE
+        return True, ""
+    except (ValueError, OverflowError):
+        return False, "Invalid number."
+
+def validate_spacing(value):
+    """Rule: SPACING_MIN <= Spacing <= SPACING_MAX (design-basis assumption, see above)"""
+    try:
+        val = float(value)
+        if val < SPACING_MIN or val > SPACING_MAX:
+            return False, SPACING_MESSAGE
+        return True, ""
+    except ValueError:
+        return False, "Invalid number."
+
+def validate_overhang(value):
+    """Rule: OVERHANG_MIN <= Overhang <= OVERHANG_MAX (design-basis assumption, see above)"""
+    try:
+        val = float(value)
+        if val < OVERHANG_MIN or val > OVERHANG_MAX:
+            return False, OVERHANG_MESSAGE
+        return True, ""
+    except ValueError:
+        return False, "Invalid number."
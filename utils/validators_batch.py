@@ -0,0 +1,183 @@
+import csv
+import numpy as np
+from utils.validators import (SPAN_MIN, SPAN_MAX, CARRIAGEWAY_MIN, CARRIAGEWAY_MAX, SKEW_MAX,
+                              GIRDERS_MIN, SPACING_MIN, SPACING_MAX, OVERHANG_MIN, OVERHANG_MAX,
+                              GIRDERS_MESSAGE, SPACING_MESSAGE, OVERHANG_MESSAGE, int_value)
+
+# Message codes returned alongside the masks; MESSAGES holds the scalar validators' text
+OK = 0
+INVALID_NUMBER = 1
+SPAN_OUT_OF_RANGE = 2
+CARRIAGEWAY_OUT_OF_RANGE = 3
+SKEW_DETAILED_ANALYSIS = 4
+GIRDERS_TOO_FEW = 5
+SPACING_OUT_OF_RANGE = 6
+OVERHANG_OUT_OF_RANGE = 7
+
+MESSAGES = {
+    OK: "",
+    INVALID_NUMBER: "Invalid number.",
+    SPAN_OUT_OF_RANGE: "Outside the software range.",
+    CARRIAGEWAY_OUT_OF_RANGE: "Carriageway width must be ≥ 4.25m and < 24m.",
+    SKEW_DETAILED_ANALYSIS: "IRC 24 (2010) requires detailed analysis",
+    GIRDERS_TOO_FEW: GIRDERS_MESSAGE,
+    SPACING_OUT_OF_RANGE: SPACING_MESSAGE,
+    OVERHANG_OUT_OF_RANGE: OVERHANG_MESSAGE,
+}
+
+def parse_floats(values):
+    """
+    Converts a column to float64 in one pass. Returns (floats, parsed_mask).
+    Numeric arrays pass straight through and clean text columns are converted in
+    one C-level sweep. Only a column with unparsable cells falls back to parsing
+    each distinct value once, so repeated values and bad cells stay cheap.
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind in "biuf":
+            return values.astype(np.float64), np.ones(values.shape, dtype=bool)
+        shape = values.shape
+        cells = values.ravel().tolist()
+    else:
+        # Plain lists (e.g. CSV columns) are parsed directly, no array round-trip
+        cells = list(values)
+        shape = (len(cells),)
+
+    try:
+        floats = np.fromiter(map(float, cells), dtype=np.float64, count=len(cells))
+        return floats.reshape(shape), np.ones(shape, dtype=bool)
+    except (ValueError, TypeError):
+        pass
+
+    lookup = {}
+    bad = set()
+    for cell in set(cells):
+        try:
+            lookup[cell] = float(cell)
+        except (ValueError, TypeError):
+            lookup[cell] = np.nan
+            bad.add(cell)
+    floats = np.fromiter(map(lookup.__getitem__, cells), dtype=np.float64, count=len(cells))
+    parsed = np.fromiter((cell not in bad for cell in cells), dtype=bool, count=len(cells))
+    return floats.reshape(shape), parsed.reshape(shape)
+
+def parse_ints(values):
+    """
+    Converts a column to int64 exactly as int_value() does in validate_girders:
+    "4" and the float 4.0 parse; "4.0", the float 4.7, "", NaN and inf don't.
+    Returns (ints, parsed_mask); unparsed cells are 0.
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind in "biu":
+            return values.astype(np.int64), np.ones(values.shape, dtype=bool)
+        if values.dtype.kind == "f":
+            parsed = np.isfinite(values) & (values == np.trunc(values))
+            return np.where(parsed, values, 0).astype(np.int64), parsed
+        shape = values.shape
+        cells = values.ravel().tolist()
+    else:
+        cells = list(values)
+        shape = (len(cells),)
+
+    try:
+        ints = np.fromiter(map(int_value, cells), dtype=np.int64, count=len(cells))
+        return ints.reshape(shape), np.ones(shape, dtype=bool)
+    except (ValueError, TypeError, OverflowError):
+        pass
+
+    # Only distinct cells are parsed; bad ones become 0 and are masked out
+    lookup = {}
+    bad = set()
+    for cell in set(cells):
+        try:
+            lookup[cell] = int_value(cell)
+        except (ValueError, TypeError, OverflowError):
+            lookup[cell] = 0
+            bad.add(cell)
+    ints = np.fromiter(map(lookup.__getitem__, cells), dtype=np.int64, count=len(cells))
+    parsed = np.fromiter((cell not in bad for cell in cells), dtype=bool, count=len(cells))
+    return ints.reshape(shape), parsed.reshape(shape)
+
+def apply_codes(parsed, failed_mask, failed_code):
+    codes = np.where(failed_mask, failed_code, OK).astype(np.uint8)
+    codes[~parsed] = INVALID_NUMBER
+    return codes
+
+def validate_span_batch(values):
+    """Rule: 20 <= Span <= 45. Returns (valid_mask, codes)."""
+    val, parsed = parse_floats(values)
+    out = (val < SPAN_MIN) | (val > SPAN_MAX)
+    return parsed & ~out, apply_codes(parsed, out, SPAN_OUT_OF_RANGE)
+
+def validate_carriageway_batch(values):
+    """Rule: 4.25 <= Carriageway < 24. Returns (valid_mask, codes)."""
+    val, parsed = parse_floats(values)
+    ok = (val >= CARRIAGEWAY_MIN) & (val < CARRIAGEWAY_MAX)
+    return parsed & ok, apply_codes(parsed, ~ok, CARRIAGEWAY_OUT_OF_RANGE)
+
+def validate_skew_batch(values):
+    """
+    Rule: Abs(Skew) <= 15. Returns (valid_mask, codes).
+    As with validate_skew, a larger skew is still valid but carries a warning code.
+    """
+    val, parsed = parse_floats(values)
+    warn = np.abs(val) > SKEW_MAX
+    return parsed, apply_codes(parsed, warn, SKEW_DETAILED_ANALYSIS)
+
+def validate_girders_batch(values):
+    """Rule: Girders >= 2, parsed like int(). Returns (valid_mask, codes)."""
+    val, parsed = parse_ints(values)
+    few = val < GIRDERS_MIN
+    return parsed & ~few, apply_codes(parsed, few, GIRDERS_TOO_FEW)
+
+def validate_spacing_batch(values):
+    """Rule: 1.5 <= Spacing <= 4.0. Returns (valid_mask, codes)."""
+    val, parsed = parse_floats(values)
+    out = (val < SPACING_MIN) | (val > SPACING_MAX)
+    return parsed & ~out, apply_codes(parsed, out, SPACING_OUT_OF_RANGE)
+
+def validate_overhang_batch(values):
+    """Rule: 0 <= Overhang <= 2.0. Returns (valid_mask, codes)."""
+    val, parsed = parse_floats(values)
+    out = (val < OVERHANG_MIN) | (val > OVERHANG_MAX)
+    return parsed & ~out, apply_codes(parsed, out, OVERHANG_OUT_OF_RANGE)
+
+# Column name -> batch validator, used by validate_columns
+BATCH_VALIDATORS = {
+    "span": validate_span_batch,
+    "carriageway": validate_carriageway_batch,
+    "skew": validate_skew_batch,
+    "girders": validate_girders_batch,
+    "spacing": validate_spacing_batch,
+    "overhang": validate_overhang_batch,
+}
+
+def validate_columns(columns):
+    """
+    Validates every known column of a {name: values} table.
+    Returns ({name: (valid_mask, codes)}, all_valid_mask) where all_valid_mask
+    is True for rows that pass every validated column.
+    """
+    results = {}
+    all_valid = None
+    for name, validator in BATCH_VALIDATORS.items():
+        if name not in columns:
+            continue
+        results[name] = validator(columns[name])
+        all_valid = results[name][0] if all_valid is None else all_valid & results[name][0]
+    return results, all_valid
+
+def messages(codes):
+    """Message text for an array of codes."""
+    table = np.array([MESSAGES[code] for code in sorted(MESSAGES)], dtype=object)
+    return table[np.asarray(codes)]
+
+def read_csv_columns(path, names=None):
+    """Reads a CSV file into {column: list of str}, optionally only `names`."""
+    with open(path, newline='') as f:
+        reader = csv.DictReader(f)
+        wanted = names or reader.fieldnames or []
+        columns = {name: [] for name in wanted}
+        for row in reader:
+            for name in wanted:
+                columns[name].append(row.get(name) or "")
+    return columns